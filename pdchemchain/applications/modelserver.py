@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from pdchemchain.base import SelfConfigurable
 from pdchemchain.links.model import ScikitMolMolModel, ScikitMolSmilesModel
@@ -10,6 +11,8 @@ import pandas as pd
 class ScikitMolModelServer(SelfConfigurable):
     model_file: str
     model_type: Literal["smiles", "mol"] = "smiles"
+    max_batch: int = 512  # Maximum number of queued predict_async requests handled in one model call
+    max_wait_ms: float = 2.0  # How long the batcher waits for more requests before dispatching a partial batch
 
     def __post_init__(self):
         super().__post_init__()
@@ -22,8 +25,56 @@ class ScikitMolModelServer(SelfConfigurable):
             self._model = ScikitMolMolModel(
                 model_file=self.model_file, in_column="smiles_or_mol"
             )
+        self._queue = None
+        self._batcher_task = None
 
     def predict(self, smiles_or_mol_list):
         df = pd.DataFrame({"smiles_or_mol": smiles_or_mol_list})
         df_out = self._model(df)
         return df_out["skmol_prediction"].values
+
+    async def predict_async(self, smiles_or_mol):
+        """Predict a single sample, micro-batched with other concurrent requests
+
+        Concurrent calls are collected over a short window (max_wait_ms, up to
+        max_batch samples) and dispatched through the Link in one go, so the
+        per-request pandas and Link overhead is amortized over the whole batch
+        instead of paid per call."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._batcher_task = loop.create_task(self._batch_worker())
+        future = loop.create_future()
+        await self._queue.put((smiles_or_mol, future))
+        return await future
+
+    async def _batch_worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000.0
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            values, futures = zip(*batch)
+            self.logger.debug(f"Dispatching micro-batch of {len(batch)} requests")
+            try:
+                # Run in the default executor so the event loop stays responsive
+                predictions = await loop.run_in_executor(
+                    None, self.predict, list(values)
+                )
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for future, prediction in zip(futures, predictions):
+                    if not future.done():
+                        future.set_result(prediction)
@@ -3,19 +3,46 @@ from __future__ import annotations
 import copy
 import importlib.metadata
 import inspect
+import os
 import traceback
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, fields
+from multiprocessing import current_process
 from pydoc import locate
 from typing import List, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
-from pdchemchain.errormanager import has_error
+from pdchemchain.errormanager import has_error, rows_with_errors
 from pdchemchain.io_utilities import load_chain, save_chain
 from pdchemchain.logging import logger, logging, RowLogger
 from pdchemchain.typing import InColumnName
 
+# With Copy-on-Write enabled, dataframes can be handed to links without defensive
+# copies, as writes clone only the affected columns. Always on from pandas 3.0,
+# opt-in for pandas 2.x, unavailable before that
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+if _PANDAS_MAJOR == 2:
+    pd.options.mode.copy_on_write = True
+COPY_ON_WRITE = _PANDAS_MAJOR >= 2
+
+
+_CLASS_CACHE = {}
+
+
+def _locate_class(classpath: str):
+    """Cached pydoc.locate, as locate walks sys.modules on every call
+
+    Only successful lookups are cached, so a class that is registered later
+    (e.g. custom links loaded into __main__) still gets found on retry."""
+    klass = _CLASS_CACHE.get(classpath)
+    if klass is None:
+        klass = locate(classpath)
+        if klass is not None:
+            _CLASS_CACHE[classpath] = klass
+    return klass
+
 
 @dataclass
 class SelfConfigurable:
@@ -25,6 +52,8 @@ class SelfConfigurable:
         logging.getLogger().setLevel(level=level)
 
         self.logger.setLevel(level=level)
+        if hasattr(self, "row_logger"):  # RowLinks cache the effective level
+            self.row_logger.invalidate_level_cache()
 
     def __post_init__(self):
         self.logger = logging.getLogger(
@@ -39,6 +68,11 @@ class SelfConfigurable:
     @classmethod
     def _get_param_names(cls):
         """Get parameter names for the estimator"""
+        # The signature introspection is expensive, so the result is cached per class.
+        # cls.__dict__ is checked rather than hasattr, which would find a superclass cache
+        if "_param_names" in cls.__dict__:
+            return cls._param_names
+
         # fetch the constructor or the original constructor before
         # deprecation wrapping if any
         init = getattr(cls.__init__, "deprecated_original", cls.__init__)
@@ -65,7 +99,8 @@ class SelfConfigurable:
                     " follow this convention." % (cls, init_signature)
                 )
         # Extract and sort argument names excluding 'self'
-        return sorted([p.name for p in parameters])
+        cls._param_names = sorted([p.name for p in parameters])
+        return cls._param_names
 
     # Inspired from https://github.com/scikit-learn/scikit-learn/blob/714c50092/sklearn/base.py#L178
     def get_params(self, defaults=True, version=True, log_level=True):
@@ -110,8 +145,10 @@ class SelfConfigurable:
 
     @classmethod
     def from_params(self, params) -> Link:
-        # Get the class reference from the string
-        params_copy = copy.deepcopy(params)
+        # Shallow copy is enough to guard the caller's dict against the pops below,
+        # nested dicts are copied the same way by their own recursive from_params call.
+        # deepcopy of a large nested config was O(n) in Python objects
+        params_copy = dict(params)
 
         if "__version__" in params_copy:
             config_version = params_copy.pop("__version__")
@@ -126,7 +163,7 @@ class SelfConfigurable:
             log_level_str = "undefined"
 
         classpath = params_copy.pop("__class__")
-        klass = locate(classpath)
+        klass = _locate_class(classpath)
         # Alternative, but requires splitting of 'path' and 'name'
         # getattr(sys.modules["__main__"], "NullLink")(name='tester')
 
@@ -172,12 +209,34 @@ class Link(ABC, SelfConfigurable):
     All links must be @dataclasses and overload the abstract method _apply(self, df: pd.DataFrame) -> pd.DataFrame
     """
 
+    # Rows per chunk when processing the dataframe in cache-friendly batches.
+    # 0 disables chunking. Values around 1024 keep the working set of a chunk in
+    # cache on typical row widths. Off by default, and must stay off for links
+    # whose semantics span rows (e.g. deduplication or file output). Class
+    # attribute rather than a dataclass field, which would force a defaulted
+    # parameter in front of required subclass fields
+    batch_size = 0
+
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         self.logger.info(f"Starting processing of dataframe with {len(df)} rows")
         self.assert_incolumns(df)
         # TODO, figure our a way to skip calculations on rows that contains errors.
+        if self.batch_size and len(df) > self.batch_size:
+            return self._batched_apply(df, self._apply)
+
         return self._apply(df)
 
+    def _batched_apply(self, df: pd.DataFrame, apply_fn) -> pd.DataFrame:
+        """Run apply_fn over batch_size-row slices and concatenate the results"""
+        self.logger.debug(
+            f"Processing dataframe in batches of {self.batch_size} rows"
+        )
+        out = [
+            apply_fn(df.iloc[i : i + self.batch_size])
+            for i in range(0, len(df), self.batch_size)
+        ]
+        return pd.concat(out)
+
     def __call__(self, df: pd.DataFrame) -> pd.DataFrame:
         return self.apply(df)
 
@@ -224,7 +283,23 @@ class Link(ABC, SelfConfigurable):
         if column_name not in df:
             df[column_name] = data
         else:
-            df[column_name] = df[column_name].combine(data, self._concatenate_strings)
+            # Vectorized version of combining with _concatenate_strings per element.
+            # Rows where only one side holds a value are handled with np.where, only
+            # the (usually few) overlapping rows fall back to the per-element combine
+            existing = df[column_name].to_numpy()
+            new = (
+                data.to_numpy() if isinstance(data, pd.Series) else np.asarray(data)
+            )
+            existing_mask = pd.notna(existing)
+            new_mask = pd.notna(new)
+            combined = np.where(existing_mask, existing, new)
+            overlap_mask = existing_mask & new_mask
+            if overlap_mask.any():
+                combined[overlap_mask] = [
+                    self._concatenate_strings(str1, str2)
+                    for str1, str2 in zip(existing[overlap_mask], new[overlap_mask])
+                ]
+            df[column_name] = pd.Series(combined, index=df.index)
         return df
 
     def append_errors(self, df: pd.DataFrame, errors: pd.Series) -> pd.DataFrame:
@@ -235,20 +310,58 @@ class Link(ABC, SelfConfigurable):
         """Append log to existing log column, or create a new one."""
         return self.append_to_column(df, log, "__log__")
 
+    @classmethod
+    def _incolumn_properties(cls) -> Tuple[str, ...]:
+        """Names of the dataclass fields typehinted as InColumnName, cached per class
+
+        The fields() scan only depends on the class, so it is done once and stored on
+        the class (looked up via cls.__dict__ to not find a superclass cache)"""
+        if "_incolumn_properties_cache" not in cls.__dict__:
+            cls._incolumn_properties_cache = tuple(
+                field.name for field in fields(cls) if field.type == InColumnName
+            )
+        return cls._incolumn_properties_cache
+
     def assert_incolumns(self, dataframe: pd.DataFrame):
         """Assert that the dataframe contains the fields that are typehinted as InColumnName in the dataclass definition"""
 
-        in_column_properties = [
-            field.name for field in fields(self) if field.type == InColumnName
+        expected_columns = [
+            getattr(self, prop) for prop in self._incolumn_properties()
         ]
-        expected_columns = [getattr(self, prop) for prop in in_column_properties]
         if expected_columns:
             self.logger.debug(f"Asserting expected input columns: {expected_columns}")
-        assert set(
-            expected_columns
-        ).issubset(
-            set(dataframe.columns)
-        ), f"DataFrame is missing expected input columns (in_columns): {set(expected_columns).difference(set(dataframe.columns))}"
+        # pd.Index.__contains__ is O(1) via its internal hashtable, so no need to build sets
+        columns = dataframe.columns
+        missing_columns = [
+            column for column in expected_columns if column not in columns
+        ]
+        assert (
+            not missing_columns
+        ), f"DataFrame is missing expected input columns (in_columns): {missing_columns}"
+
+
+class _Row(dict):
+    """Lightweight dict-backed row used by the itertuples row engine
+
+    Covers the subset of the pd.Series interface that _row_apply implementations
+    use: item access and assignment by column name, .get, attribute access to
+    column values (e.g. row.A in pd.eval expressions), .copy() and a .name
+    attribute holding the index label. Building one of these per row is much
+    cheaper than the pd.Series that DataFrame.apply(axis=1) materializes.
+    """
+
+    def __init__(self, *args, name=None):
+        super().__init__(*args)
+        self.name = name
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def copy(self) -> "_Row":
+        return _Row(self, name=self.name)
 
 
 class RowLink(Link):
@@ -256,13 +369,23 @@ class RowLink(Link):
 
     All subclasses must be @dataclasses and overload the _row_apply(self, row: pd.Series) -> pd.Series method
 
-    rows are pd.Series and values can be indexed via the column name, e.g. row[self.in_column]
+    rows are dict-like (pd.Series or the internal _Row) and values can be indexed via the column name, e.g. row[self.in_column]
 
     new values for new columns can be directly set like example row[self.out_column] = new_value
+
+    Subclasses that compute a single out_column value from the values of their InColumnName
+    fields can additionally define _row_apply_scalar(self, *values) -> value. Links with this
+    hook are processed via a vectorized fast path that iterates the underlying numpy arrays
+    directly, avoiding the per-row pd.Series construction of DataFrame.apply(axis=1)
     """
 
+    _row_apply_scalar = None  # Overload with a method to opt into the vectorized fast path
+    _needs_deepcopy = False  # Set True in subclasses whose _row_apply mutates objects nested in the row (a shallow copy is enough for links that only assign new values)
+
     def __post_init__(self):
         super().__post_init__()
+        self.n_jobs = 1  # Number of joblib workers for apply(). 1 disables parallelism, -1 uses all cores. Not a dataclass field, as that would force a default-valued parameter in front of required subclass fields
+        self.parallel_backend = "loky"  # joblib backend for _parallel_apply. "multiprocessing" uses a forked chunked Pool, cheaper to start but less robust than loky
         self.row_logger = RowLogger(
             self
         )  # Instantiate the row_logger, enabling easy logging of messages to a "__log__" column on a specific row
@@ -275,8 +398,134 @@ class RowLink(Link):
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         self.assert_incolumns(df)
         self.logger.info(f"Processing dataframe with {len(df)} rows, row by row")
-        # This should be reasonable efficient: https://www.learndatasci.com/solutions/how-iterate-over-rows-pandas/
-        return df.apply(self._safe_row_apply, axis=1)
+        if (
+            self.n_jobs != 1
+            and len(df) > 1
+            # Guard against nested pools when the link itself runs in a worker
+            # process (e.g. inside a ParallelPartitionProcessor partition)
+            and current_process().name == "MainProcess"
+        ):
+            return self._parallel_apply(df)
+        if self.batch_size and len(df) > self.batch_size:
+            return self._batched_apply(df, self._apply_rows)
+        return self._apply_rows(df)
+
+    def _apply_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Single-process row engine, used directly or per chunk by _parallel_apply"""
+        if self._row_apply_scalar is not None:
+            return self._vector_apply(df)
+        if "__error__" in df.columns:
+            # Split off the error rows with one vectorized mask, so _row_apply only runs
+            # on the clean subset instead of checking has_error per row
+            error_mask = rows_with_errors(df)
+            if error_mask.any():
+                if error_mask.all():
+                    return df
+                processed = self._iter_apply(df[~error_mask])
+                # Restore the input row order positionally; sort_index would
+                # scramble non-monotonic indexes and interleave duplicate labels
+                positions = np.concatenate(
+                    [np.flatnonzero(~error_mask), np.flatnonzero(error_mask)]
+                )
+                return pd.concat([processed, df[error_mask]]).iloc[
+                    np.argsort(positions)
+                ]
+        return self._iter_apply(df)
+
+    def _iter_apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Iterate the rows with itertuples and dict-backed _Row helpers
+
+        DataFrame.apply(axis=1) is the slowest of the pandas row iterators, as it
+        builds a full pd.Series per row. itertuples yields plain tuples, which are
+        rewrapped in the much lighter _Row, and the processed rows are assembled
+        back into a dataframe in one constructor call.
+        (see https://www.learndatasci.com/solutions/how-iterate-over-rows-pandas/)
+        """
+        if df.empty:
+            return df
+        columns = df.columns
+        # Output columns are preallocated and filled in place during the single pass,
+        # rather than keeping every processed row alive and letting the DataFrame
+        # constructor reassemble them. Columns first seen mid-iteration (e.g. __error__
+        # appearing on a late row) are allocated on discovery, NaN-filled for the rows
+        # already passed
+        n = len(df)
+        out = {column: np.full(n, np.nan, dtype=object) for column in columns}
+        for i, values in enumerate(df.itertuples(index=True, name=None)):
+            row = self._safe_row_apply(_Row(zip(columns, values[1:]), name=values[0]))
+            for key, value in row.items():
+                array = out.get(key)
+                if array is None:
+                    array = out[key] = np.full(n, np.nan, dtype=object)
+                array[i] = value
+        # The object arrays are converted back to their natural dtypes in one go
+        return pd.DataFrame(out, index=df.index).infer_objects()
+
+    def _parallel_apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Process the dataframe in parallel chunks with joblib
+
+        Rows are independent, so the dataframe is split into n_jobs*4 chunks that are
+        dispatched to worker processes and concatenated afterwards. Chunk-level
+        dispatch keeps the pickling overhead per task low compared to per-row
+        submission. The pool backend is selected with the parallel_backend attribute
+        (loky by default, "multiprocessing" for a forked multiprocessing.Pool).
+        Requires joblib to be installed.
+        """
+        from pdchemchain.utilities import (
+            assert_import_dependency,
+        )  # Local import, utilities imports from the pdchemchain package
+
+        assert_import_dependency("joblib")
+        from joblib import Parallel, delayed
+
+        n_workers = self.n_jobs if self.n_jobs > 0 else (os.cpu_count() or 1)
+        bounds = np.linspace(0, len(df), min(len(df), n_workers * 4) + 1, dtype=int)
+        chunks = [df.iloc[a:b] for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+        self.logger.debug(
+            f"Processing {len(chunks)} chunks with {self.n_jobs} joblib workers"
+        )
+        processed = Parallel(n_jobs=self.n_jobs, backend=self.parallel_backend)(
+            delayed(self._apply_rows)(chunk) for chunk in chunks
+        )
+        return pd.concat(processed)
+
+    def _in_column_names(self) -> List[str]:
+        """The column names held by the fields that are typehinted as InColumnName"""
+        return [getattr(self, prop) for prop in self._incolumn_properties()]
+
+    def _vector_apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized fast path for subclasses that define _row_apply_scalar
+
+        Extracts the InColumnName columns as numpy arrays once, runs the scalar hook in a
+        tight loop and assigns the output column in bulk, rather than materializing a
+        pd.Series per row. Rows that already contain errors are skipped, and exceptions
+        from the scalar hook are collected and appended to the __error__ column in one go.
+        """
+        in_arrays = [df[column].to_numpy() for column in self._in_column_names()]
+        n = len(df)
+        skip_mask = np.array(rows_with_errors(df, aslist=True), dtype=bool)
+        results = [None] * n
+        errors = np.full(n, None, dtype=object)
+        for i in range(n):
+            if skip_mask[i]:
+                continue
+            try:
+                results[i] = self._row_apply_scalar(*(array[i] for array in in_arrays))
+            except Exception:
+                errors[i] = traceback.format_exc()
+
+        df = df.copy()
+        error_mask = pd.notna(errors)
+        untouched_mask = skip_mask | error_mask
+        if self.out_column in df.columns and untouched_mask.any():
+            # Skipped and failed rows keep their existing values, as in the row-by-row path
+            original = df[self.out_column].to_numpy()
+            for i in np.nonzero(untouched_mask)[0]:
+                results[i] = original[i]
+        df[self.out_column] = pd.Series(results, index=df.index)
+        if error_mask.any():
+            df = self.append_errors(df, pd.Series(errors, index=df.index))
+        return df
 
     def _create_or_append(
         self, row: pd.Series, data: str, column_name: str = "__error__"
@@ -290,7 +539,10 @@ class RowLink(Link):
         return row
 
     def _safe_row_apply(self, row: pd.Series) -> pd.Series:
-        row = copy.deepcopy(row)
+        # deepcopy recursed into every object in the row (including RDKit Mols) via the
+        # pickle machinery, a shallow copy of the row values is enough for links that
+        # only assign new scalars/objects
+        row = copy.deepcopy(row) if self._needs_deepcopy else row.copy()
 
         if not has_error(
             row
@@ -311,18 +563,68 @@ class RowLink(Link):
         return row
 
 
+@dataclass
+class FusedRowLink(RowLink):
+    """Applies several RowLinks in a single pass over the rows
+
+    Used by Chain to merge runs of adjacent RowLinks, so the dataframe is traversed once
+    instead of once per link. Each row passes through the _safe_row_apply of every fused
+    link in order, preserving the per-link error handling of sequential execution.
+    """
+
+    row_links: Union[List[RowLink], Tuple[RowLink]]
+
+    def assert_incolumns(self, dataframe: pd.DataFrame):
+        # Only the first fused link's columns can be checked up front, later links may
+        # consume columns created earlier in the same row pass
+        self.row_links[0].assert_incolumns(dataframe)
+
+    def _row_apply(self, row: pd.Series) -> pd.Series:
+        for row_link in self.row_links:
+            row = row_link._safe_row_apply(row)
+        return row
+
+
 @dataclass
 class Chain(Link):
-    """Runs links sequentially, one after the other and return the processed dataframe."""
+    """Runs links sequentially, one after the other and return the processed dataframe.
+
+    Runs of adjacent RowLinks are fused into a single row pass on first apply.
+    NB mutating .links directly after the first apply will not be picked up,
+    use the + operator to extend chains instead.
+
+    With early_exit=True the chain stops walking the remaining links once the
+    dataframe is empty or every row carries an error, saving full pipeline passes
+    over rows that produce no output anyway. Off by default, since links like
+    FromFile legitimately repopulate an empty dataframe mid-chain."""
 
     links: Union[List[Link], Tuple[Link]]
+    early_exit: bool = False
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._fused_links = None
+        self._flat_links = None
+
+    def _iter_links(self):
+        """Yield all nested links depth-first, containers included"""
+        for link in self.links:
+            yield link
+            if isinstance(link, (Chain, UnionLink)):
+                yield from link._iter_links()
 
     def set_log_level(self, level_str: str = "debug"):
         level = logging.getLevelName(level_str.upper())
         logging.basicConfig(level=level)
         self.logger.setLevel(level=level)
-        for link in self.links:
-            link.set_log_level(level_str)
+        # The flattened link list is computed once and reused, instead of recursing
+        # through nested Chains/UnionLinks on every call
+        if self._flat_links is None:
+            self._flat_links = list(self._iter_links())
+        for link in self._flat_links:
+            link.logger.setLevel(level=level)
+            if hasattr(link, "row_logger"):  # RowLinks cache the effective level
+                link.row_logger.invalidate_level_cache()
 
     def __add__(self, other):
         if not other:
@@ -341,14 +643,100 @@ class Chain(Link):
         # TODO This is a code smell that something is not completely right with the class hierachy
         raise RuntimeError("This function should not be called in the Chain class")
 
+    def _fuse(self) -> List[Link]:
+        """Merge runs of adjacent plain RowLinks in self.links into FusedRowLink instances
+
+        Only links that use the per-row engine are fused. Links with a
+        _row_apply_scalar hook or their own _apply_rows override process whole
+        columns at a time, and funneling them through FusedRowLink would
+        silently replace that fast path with a per-row loop
+        """
+        fused_links = []
+        run = []
+
+        def is_fusable(link):
+            return (
+                isinstance(link, RowLink)
+                and link._row_apply_scalar is None
+                and type(link)._apply_rows is RowLink._apply_rows
+            )
+
+        def flush_run():
+            if len(run) == 1:
+                fused_links.append(run[0])
+            elif len(run) > 1:
+                fused_links.append(FusedRowLink(row_links=list(run)))
+            run.clear()
+
+        for link in self.links:
+            if is_fusable(link):
+                run.append(link)
+            else:
+                flush_run()
+                fused_links.append(link)
+        flush_run()
+        return fused_links
+
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply the links independent of each other and join"""
-        self.logger.debug(f"Starting sequential processing of {len(self.links)} Link")
-        for link in self.links:
+        if self._fused_links is None:
+            self._fused_links = self._fuse()
+            if len(self._fused_links) != len(self.links):
+                self.logger.debug(
+                    f"Fused {len(self.links)} links into {len(self._fused_links)} for single row passes"
+                )
+        self.logger.debug(
+            f"Starting sequential processing of {len(self._fused_links)} Link"
+        )
+        for link in self._fused_links:
             df = link(df)
+            if self.early_exit and self._no_useful_rows(df):
+                self.logger.info(
+                    "No rows left without errors, skipping the remaining links"
+                )
+                break
         self.logger.debug("Sequential processing done")
         return df
 
+    def _no_useful_rows(self, df: pd.DataFrame) -> bool:
+        """True if the dataframe is empty or every row carries an error"""
+        if len(df) == 0:
+            return True
+        return all(rows_with_errors(df, aslist=True))
+
+    def apply_dask(
+        self, df: pd.DataFrame, npartitions: int = None, scheduler: str = "processes"
+    ) -> pd.DataFrame:
+        """Apply the chain partition-wise via dask for out-of-core or distributed execution
+
+        The dataframe is converted to a dask dataframe and each link is composed with
+        map_partitions, so partitions stream through the chain via the dask scheduler
+        instead of pushing the full dataframe through each link in a single process.
+        The output schema (meta) for each step is discovered by running the links once
+        on the first row of the dataframe. Requires dask to be installed.
+        NB links with side effects (e.g. writing files) will see that first row twice.
+        """
+        from pdchemchain.utilities import (
+            assert_import_dependency,
+        )  # Local import, utilities imports from the pdchemchain package
+
+        assert_import_dependency("dask", install_name="dask[dataframe]")
+        import dask.dataframe as dd
+
+        if npartitions is None:
+            npartitions = os.cpu_count() or 1
+        self.logger.debug(
+            f"Starting dask processing of {len(self.links)} Link with {npartitions} partitions"
+        )
+        ddf = dd.from_pandas(df, npartitions=npartitions)
+        meta = df.head(1)
+        for link in self.links:
+            meta = link(meta)
+            ddf = ddf.map_partitions(link, meta=meta)
+        result = ddf.compute(scheduler=scheduler)
+        self.logger.debug("Dask processing done")
+        return result
+
 
 @dataclass
 class UnionLink(Link):
@@ -359,6 +747,13 @@ class UnionLink(Link):
     link1: Link
     link2: Link
 
+    def _iter_links(self):
+        """Yield all nested links depth-first, containers included"""
+        for link in (self.link1, self.link2):
+            yield link
+            if isinstance(link, (Chain, UnionLink)):
+                yield from link._iter_links()
+
     def set_log_level(self, level_str: str = "debug"):
         level = logging.getLevelName(level_str.upper())
         logging.basicConfig(level=level)
@@ -378,13 +773,11 @@ class UnionLink(Link):
         """
         self.logger.debug("Starting processing of seperate Links or Chains")
         self.logger.debug("Processing of first Link or Chain")
-        df1 = self.link1(
-            df.copy()
-        )  # Apply first link to a copy of the original dataframe
+        # Under Copy-on-Write the original dataframe can be passed directly, writes in
+        # the links clone only the affected columns. Older pandas needs the full copies
+        df1 = self.link1(df if COPY_ON_WRITE else df.copy())
         self.logger.debug("Processing of second Link or Chain")
-        df2 = self.link2(
-            df.copy()
-        )  # Apply second link to a copy of the original dataframe
+        df2 = self.link2(df if COPY_ON_WRITE else df.copy())
         self.logger.debug("Done processing, joining dataframes")
         return df1.combine_first(df2)
 
@@ -1,5 +1,5 @@
+import os
 import sys
-from io import StringIO
 from traceback import format_exception
 from typing import List, Union
 
@@ -33,19 +33,52 @@ def rows_with_errors(
     return list(result) if aslist else result
 
 
-class ErrorContextManager:
+class _StderrCapture:
+    """Capture stderr at the file descriptor level via os.dup2 and a pipe
+
+    Swapping sys.stderr for a StringIO only catches Python-level writes, whereas
+    RDKit writes via C++ std::cerr directly to fd 2. Redirecting the fd itself into
+    a pipe captures those bytes too, and replaces per-line Python write dispatch
+    with a single read on exit. The write end is made non-blocking, so a very
+    chatty block drops excess output rather than deadlocking on a full pipe."""
+
+    def _redirect_stderr(self):
+        sys.stderr.flush()
+        self._saved_fd = os.dup(2)
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(write_fd, False)
+        os.dup2(write_fd, 2)
+        os.close(write_fd)
+        self._read_fd = read_fd
+
+    def _restore_and_read_stderr(self) -> str:
+        os.dup2(self._saved_fd, 2)
+        os.close(self._saved_fd)
+        # All write ends of the pipe are closed after the dup2 above, so reading
+        # until EOF cannot block
+        chunks = []
+        while True:
+            chunk = os.read(self._read_fd, 1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        os.close(self._read_fd)
+        return b"".join(chunks).decode(errors="replace")
+
+
+class ErrorContextManager(_StderrCapture):
     def __init__(self):
         self.errors = ""
 
     def __enter__(self):
         # capture std.error
-        sys.stderr = self.error_output_buffer = StringIO()
+        self._redirect_stderr()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         errors = ""
         # Save the captured output
-        stderr_output = self.error_output_buffer.getvalue()
+        stderr_output = self._restore_and_read_stderr()
 
         if stderr_output:
             # Someone wrote to stderr (e.g. RDKit) #TODO, is this _always_ errors?
@@ -60,38 +93,27 @@ class ErrorContextManager:
 
         self.errors = errors
 
-        # reset stderr to standard
-        sys.stderr = sys.__stderr__
-
         return True  # Returns True as we are handling the errors
 
 
-class RDKitErrorContextManager:
+class RDKitErrorContextManager(_StderrCapture):
     def __init__(self):
         self.errors = ""
 
     def __enter__(self):
         # capture std.error
-        sys.stderr = self.error_output_buffer = StringIO()
+        self._redirect_stderr()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         errors = ""
         # Save the captured output
-        stderr_output = self.error_output_buffer.getvalue()
+        stderr_output = self._restore_and_read_stderr()
 
         if stderr_output:
             # Someone wrote to stderr (e.g. RDKit) #TODO, is this _always_ errors?
             errors = errors + stderr_output + "\n"
 
-        # if exc_type is not None:
-        #     # An exception occurred within the context
-        #     msg = "".join(format_exception(exc_type, exc_value, traceback)) #TODO, do this end in \n?
-        #     errors = errors + msg
-
         self.errors = errors
 
-        # reset stderr to standard
-        sys.stderr = sys.__stderr__
-
         # return True #Returns True as we are handling the errors
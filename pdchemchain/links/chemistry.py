@@ -1,14 +1,15 @@
-import copy
+import functools
 from dataclasses import dataclass, field
 from typing import List
 
+import numpy as np
 import pandas as pd
 from rdkit import Chem
 from rdkit.Chem import Descriptors, PandasTools
 from rdkit.Chem.MolStandardize import rdMolStandardize
 from rdkit.ML.Descriptors.MoleculeDescriptors import MolecularDescriptorCalculator
 
-from pdchemchain.base import Link, RowLink
+from pdchemchain.base import COPY_ON_WRITE, Link, RowLink
 from pdchemchain.errormanager import RDKitErrorContextManager
 from pdchemchain.typing import InColumnName
 
@@ -36,13 +37,21 @@ class ElementsInList(RowLink):
         default_factory=lambda: [6, 7, 8, 9, 16, 17, 35]
     )  # How does it work with set?
 
+    def __post_init__(self):
+        super().__post_init__()
+        # frozenset gives O(1) membership tests, instead of scanning the list per atom
+        self._allowed = frozenset(self.allowed_elements)
+
     def _all_elements_in_allowed_set(self, mol: Chem.Mol) -> bool:
-        mol_elements = set(atom.GetAtomicNum() for atom in mol.GetAtoms())
-        return mol_elements.issubset(self.allowed_elements)
+        # Short-circuits on the first disallowed atom
+        return all(atom.GetAtomicNum() in self._allowed for atom in mol.GetAtoms())
+
+    # The scalar hook opts into the vectorized row engine, see RowLink._vector_apply
+    def _row_apply_scalar(self, mol: Chem.Mol) -> bool:
+        return self._all_elements_in_allowed_set(mol)
 
     def _row_apply(self, row: pd.Series) -> pd.Series:
-        mol = row[self.in_column]
-        row[self.out_column] = self._all_elements_in_allowed_set(mol)
+        row[self.out_column] = self._row_apply_scalar(row[self.in_column])
         return row
 
 
@@ -61,9 +70,12 @@ class HeavyAtomCount(RowLink):
     in_column: InColumnName = "ROMol"
     out_column: str = "HeavyAtomCount"
 
+    def _row_apply_scalar(self, mol: Chem.Mol) -> int:
+        # Direct C++ call, Descriptors.HeavyAtomCount is a Python wrapper around it
+        return mol.GetNumHeavyAtoms()
+
     def _row_apply(self, row: pd.Series) -> pd.Series:
-        mol = row[self.in_column]
-        row[self.out_column] = Descriptors.HeavyAtomCount(mol)
+        row[self.out_column] = self._row_apply_scalar(row[self.in_column])
         return row
 
 
@@ -85,7 +97,7 @@ class HeteroAtomRatio(RowLink):
     out_column: str = "HeteroAtomRatio"
 
     def _heteroatom_ratio(self, mol: Chem.Mol) -> float:
-        heavy_atoms: int = Descriptors.HeavyAtomCount(mol)
+        heavy_atoms: int = mol.GetNumHeavyAtoms()  # Direct C++ call, skips the Descriptors wrapper
         hetero_atoms: int = Descriptors.NumHeteroatoms(
             mol
         )  # sum(1 for atom in mol.GetAtoms() if atom.GetAtomicNum() not in [6, 1])  # Exclude C and H
@@ -93,9 +105,11 @@ class HeteroAtomRatio(RowLink):
             hetero_atoms / heavy_atoms if heavy_atoms > 0 else 0.0
         )  # Avoid division by zero
 
+    def _row_apply_scalar(self, mol: Chem.Mol) -> float:
+        return self._heteroatom_ratio(mol)
+
     def _row_apply(self, row: pd.Series) -> pd.Series:
-        mol = row[self.in_column]
-        row[self.out_column] = self._heteroatom_ratio(mol)
+        row[self.out_column] = self._row_apply_scalar(row[self.in_column])
         return row
 
 
@@ -119,24 +133,36 @@ class LongestAliphaticChain(RowLink):
     out_column: str = "LongestAliphaticChain"
     max_chain_length: int = 11
 
+    _SMARTS_CACHE = {}  # Compiled SMARTS shared between instances, keyed by max_chain_length. Not annotated, so not a dataclass field
+
     def __post_init__(self):
         super().__post_init__()
-        self.SMARTS_CHAINS = [
-            Chem.MolFromSmarts("-".join(["[CR0H2]"] * i))
-            for i in range(1, self.max_chain_length + 1)
-        ]
+        chains = self._SMARTS_CACHE.get(self.max_chain_length)
+        if chains is None:
+            chains = self._SMARTS_CACHE[self.max_chain_length] = [
+                Chem.MolFromSmarts("-".join(["[CR0H2]"] * i))
+                for i in range(1, self.max_chain_length + 1)
+            ]
+        self.SMARTS_CHAINS = chains
 
     def _find_longest_aliphatic_chain_length(self, mol: Chem.Mol) -> int:
-        for i, chain in enumerate(self.SMARTS_CHAINS, start=1):
-            if mol.HasSubstructMatch(chain):
-                continue
-            return i - 1  # -1 to adjust for 0-based index
-
-        return 0
+        # A chain of length i matching implies all shorter chains match, so the longest
+        # match can be found with a binary search, log2(N) HasSubstructMatch calls
+        # instead of up to N
+        lo, hi = 0, len(self.SMARTS_CHAINS)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if mol.HasSubstructMatch(self.SMARTS_CHAINS[mid]):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _row_apply_scalar(self, mol: Chem.Mol) -> int:
+        return self._find_longest_aliphatic_chain_length(mol)
 
     def _row_apply(self, row: pd.Series) -> pd.Series:
-        mol = row[self.in_column]
-        row[self.out_column] = self._find_longest_aliphatic_chain_length(mol)
+        row[self.out_column] = self._row_apply_scalar(row[self.in_column])
         return row
 
 
@@ -152,15 +178,101 @@ class MolFromSmiles(RowLink):
         The label for the column containing the SMILES strings to convert
     out_column
         The label for the column that should store the RDKit molecular objects
+    cache_size
+        When above 0, memoize up to this many SMILES->Mol parses, so repeated
+        identical SMILES (salts, duplicates) are only parsed once. Cache hits
+        share the parsed Mol object between rows, so downstream links must not
+        mutate the molecules in place. Costs memory proportional to the cache
+        size, disabled by default
     """
 
     in_column: InColumnName = "Smiles"
     out_column: str = "ROMol"
+    cache_size: int = 0
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.cache_size:
+            self._cached_parse = functools.lru_cache(maxsize=self.cache_size)(
+                Chem.MolFromSmiles
+            )
+        else:
+            self._cached_parse = None
+
+    def _apply_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Batch path: the whole SMILES column is parsed in one supplier call
+
+        Chem.SmilesMolSupplierFromText parses all rows inside a single C++ call,
+        with a single stderr capture around the batch, instead of one
+        Chem.MolFromSmiles call and one RDKitErrorContextManager per row.
+        The supplier preserves input order (the multithreaded supplier does not,
+        which is why it is not used here). Rows with non-string values or
+        pre-existing errors are excluded from the batch and handled like in the
+        row-by-row path.
+        """
+        from pdchemchain.errormanager import rows_with_errors
+
+        smiles = df[self.in_column].to_numpy()
+        n = len(df)
+        skip_mask = np.array(rows_with_errors(df, aslist=True), dtype=bool)
+        str_mask = np.fromiter(
+            (isinstance(s, str) for s in smiles), dtype=bool, count=n
+        )
+        errors = np.full(n, None, dtype=object)
+        mols = np.full(n, None, dtype=object)
+
+        indices = np.nonzero(str_mask & ~skip_mask)[0]
+        if len(indices):
+            e = RDKitErrorContextManager()
+            with e:
+                if self._cached_parse is not None:
+                    # Memoized per-SMILES parsing, repeated SMILES hit the cache
+                    parsed = [self._cached_parse(smiles[i]) for i in indices]
+                else:
+                    # The dummy name column silences per-line "no name column" warnings
+                    text = "\n".join(f"{smiles[i]}\t." for i in indices)
+                    supplier = Chem.SmilesMolSupplierFromText(
+                        text,
+                        delimiter="\t",
+                        smilesColumn=0,
+                        nameColumn=1,
+                        titleLine=False,
+                    )
+                    # Iterated with a comprehension: list() probes len(), which
+                    # seeks the supplier's stream to the end and yields no molecules
+                    parsed = [mol for mol in supplier]
+            for i, mol in zip(indices, parsed):
+                if mol is None:
+                    errors[i] = f"SMILES parsing failed. RDKit Error: {e.errors}"
+                else:
+                    mols[i] = mol
+
+        nonstr_mask = ~str_mask & ~skip_mask
+        for i in np.nonzero(nonstr_mask)[0]:
+            errors[i] = (
+                f"SMILES parsing failed. Value is not a string: "
+                f"{smiles[i]} of type {type(smiles[i])}"
+            )
+
+        df = df.copy()
+        error_mask = pd.notna(errors)
+        untouched_mask = skip_mask | error_mask
+        if self.out_column in df.columns and untouched_mask.any():
+            original = df[self.out_column].to_numpy()
+            for i in np.nonzero(untouched_mask)[0]:
+                mols[i] = original[i]
+        df[self.out_column] = pd.Series(mols, index=df.index)
+        if error_mask.any():
+            df = self.append_errors(df, pd.Series(errors, index=df.index))
+        return df
 
     def _row_apply(self, row: pd.Series) -> pd.Series:
         e = RDKitErrorContextManager()
         with e:
-            mol = Chem.MolFromSmiles(row[self.in_column])
+            if self._cached_parse is not None:
+                mol = self._cached_parse(row[self.in_column])
+            else:
+                mol = Chem.MolFromSmiles(row[self.in_column])
         # if "pytest" in sys.modules and mol is None:
         #      raise ValueError ("SMILES parsing failed with unknown error. Seemingly running under pytest where error context manager is not fully functional.")
         if mol is None:
@@ -187,8 +299,11 @@ class MolToSmiles(RowLink):
     in_column: InColumnName = "ROMol"
     out_column: str = "Smiles"
 
+    def _row_apply_scalar(self, mol: Chem.Mol) -> str:
+        return Chem.MolToSmiles(mol)
+
     def _row_apply(self, row: pd.Series) -> pd.Series:
-        row[self.out_column] = Chem.MolToSmiles(row[self.in_column])
+        row[self.out_column] = self._row_apply_scalar(row[self.in_column])
         return row
 
 
@@ -230,6 +345,29 @@ class NumberOfTokens(RowLink):
                 "Please install it using: pip install git+ssh://git@github.com/EBjerrum/pysmilesutils.git"
             ) from e
 
+    def _apply_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Batch path: the whole SMILES column is tokenized in one call
+
+        The tokenizer is designed for batched input, so one tokenize call over the
+        full column amortizes its per-call overhead across all rows. Only used when
+        every row is a clean string; mixed or error-carrying input falls back to
+        the row-by-row engine and its per-row error handling.
+        """
+        from pdchemchain.errormanager import rows_with_errors
+
+        smiles = df[self.in_column].to_numpy()
+        clean = not any(rows_with_errors(df, aslist=True)) and all(
+            isinstance(s, str) for s in smiles
+        )
+        if not clean:
+            return super()._apply_rows(df)
+        token_lists = self.tokenizer.tokenize(list(smiles), enclose=False)
+        df = df.copy()
+        df[self.out_column] = np.fromiter(
+            (len(tokens) for tokens in token_lists), dtype=np.int32, count=len(df)
+        )
+        return df
+
     def _row_apply(self, row: pd.Series) -> pd.Series:
         """Number of tokens from the smiles string, without start and end tokens"""
         smiles = row[self.in_column]
@@ -263,7 +401,10 @@ class PandasAddMoleculeColumn(Link):
     includeFingerprints: bool = False
 
     def _apply(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()  # PandasTools mutates the dataframe
+        # PandasTools mutates the dataframe, but it only assigns the molecule column,
+        # so under Copy-on-Write a shallow copy protects the input without copying
+        # every unrelated column
+        df = df.copy(deep=False) if COPY_ON_WRITE else df.copy()
         PandasTools.AddMoleculeColumnToFrame(
             df,
             smilesCol=self.smilesCol,
@@ -273,11 +414,18 @@ class PandasAddMoleculeColumn(Link):
 
         # Example on error handling on the df level
         error_mask = df[self.molCol].isna()
-        if sum(error_mask) > 0:
-            errors = pd.Series([None] * len(df))
-            errors[error_mask] = "Error in PandasTools SMILES conversion"
+        if error_mask.any():  # Short-circuits in C, unlike Python-level sum()
+            errors = pd.Series(
+                np.where(
+                    error_mask.to_numpy(), "Error in PandasTools SMILES conversion", None
+                ),
+                index=df.index,
+                dtype=object,
+            )
             df = self.append_errors(df, errors)
-            self.logger.warning(f"{len(errors)} SMILES failed in conversion")
+            self.logger.warning(
+                f"{int(error_mask.sum())} SMILES failed in conversion"
+            )
         return df
 
 
@@ -307,6 +455,40 @@ class RDKitDescriptors(RowLink):
         super().__post_init__()
         self.calculator = MolecularDescriptorCalculator(self.descriptors)
 
+    def _apply_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Batch path: descriptors are filled into one preallocated 2D array
+
+        The descriptor values land in a (rows, descriptors) float64 array that is
+        assigned as columns in one go, instead of growing a row object descriptor
+        by descriptor and re-inferring dtypes on reassembly. Non-Mol values are
+        reported in the __error__ column and rows already carrying errors are
+        skipped, keeping NaN in their descriptor columns.
+        """
+        from pdchemchain.errormanager import rows_with_errors
+
+        mols = df[self.in_column].to_numpy()
+        n = len(df)
+        skip_mask = np.array(rows_with_errors(df, aslist=True), dtype=bool)
+        values = np.full((n, len(self.descriptors)), np.nan, dtype=np.float64)
+        errors = np.full(n, None, dtype=object)
+        for i, mol in enumerate(mols):
+            if skip_mask[i]:
+                continue
+            if isinstance(mol, Chem.Mol):
+                values[i] = self.calculator.CalcDescriptors(mol)
+            else:
+                errors[i] = (
+                    f"Descriptor calculation failed. Seemingly not a Mol object: "
+                    f"{mol} of type {type(mol)}"
+                )
+
+        df = df.assign(
+            **{name: values[:, j] for j, name in enumerate(self.descriptors)}
+        )
+        if pd.notna(errors).any():
+            df = self.append_errors(df, pd.Series(errors, index=df.index))
+        return df
+
     def _row_apply(self, row: pd.Series) -> pd.Series:
         mol = row[self.in_column]
         if isinstance(mol, Chem.Mol):
@@ -342,9 +524,9 @@ class RemoveStereoMol(RowLink):
     out_column: str = "ROMol"
 
     def _row_apply(self, row: pd.Series) -> pd.Series:
-        mol = copy.deepcopy(
-            row[self.in_column]
-        )  # TODO, whats most efficient, working on copies of the rows/objects or simply copy the dataframe?
+        # The RDKit copy constructor clones the molecule in C++, much cheaper than
+        # deepcopy which round-trips the Mol through the pickle machinery
+        mol = Chem.Mol(row[self.in_column])
         Chem.RemoveStereochemistry(mol)  # This mutates the input column?
         row[self.out_column] = mol
         return row
@@ -367,6 +549,44 @@ class RemoveStereoSmiles(RowLink):
     in_column: InColumnName = "Smiles"
     out_column: str = "Smiles"
 
+    def _apply_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Batch path: the @ characters are stripped with one vectorized str.replace
+
+        Non-string values are reported in the __error__ column and rows already
+        carrying errors are left untouched, matching the row-by-row semantics.
+        """
+        from pdchemchain.errormanager import rows_with_errors
+
+        n = len(df)
+        raw = df[self.in_column].to_numpy()
+        skip_mask = np.array(rows_with_errors(df, aslist=True), dtype=bool)
+        str_mask = np.fromiter((isinstance(v, str) for v in raw), dtype=bool, count=n)
+        process_mask = str_mask & ~skip_mask
+
+        df = df.copy()
+        if self.out_column in df.columns:
+            out = df[self.out_column].to_numpy().copy()
+        else:
+            out = np.full(n, np.nan, dtype=object)
+        if process_mask.any():
+            # The .str accessor raises on non-object columns (empty or numeric
+            # frames), so the replace only ever sees the masked string values
+            out[process_mask] = (
+                pd.Series(raw[process_mask]).str.replace("@", "", regex=False).to_numpy()
+            )
+        df[self.out_column] = pd.Series(out, index=df.index)
+
+        error_mask = ~str_mask & ~skip_mask
+        if error_mask.any():
+            errors = np.full(n, None, dtype=object)
+            for i in np.nonzero(error_mask)[0]:
+                errors[i] = (
+                    f"Stereo removal failed. Value is not a string: "
+                    f"{raw[i]} of type {type(raw[i])}"
+                )
+            df = self.append_errors(df, pd.Series(errors, index=df.index))
+        return df
+
     def _row_apply(self, row: pd.Series) -> pd.Series:
         row[self.out_column] = row[self.in_column].replace("@", "")
         return row
@@ -387,21 +607,50 @@ class SuperParent(RowLink):
         The label for the column that should store the standardized molecules
     maxTautomers
         The maximum number of tautormers to generate during standardization attempts
+    cache_size
+        When above 0, memoize up to this many standardizations keyed on the
+        canonical SMILES of the input molecule, so duplicate structures are only
+        standardized once. Cache hits share the standardized Mol object between
+        rows. Costs memory proportional to the cache size, disabled by default
     """
 
     in_column: InColumnName = "ROMol"
     out_column: str = "ROMol"
     maxTautomers: int = 0
+    cache_size: int = 0
 
-    def _row_apply(self, row: pd.Series) -> pd.Series:
-        mol = copy.deepcopy(row[self.in_column])
-        if (
-            self.maxTautomers != 1000
-        ):  # TODO, what's the overhead of reinstating the params each time?
+    def __post_init__(self):
+        super().__post_init__()
+        # The parameters are fixed per link instance, so they are built once here
+        # instead of allocating a fresh CleanupParameters object per row
+        if self.maxTautomers != 1000:  # 1000 is the RDKit default
             params = rdMolStandardize.CleanupParameters()
             params.maxTautomers = self.maxTautomers
-            mol = rdMolStandardize.SuperParent(mol, params=params)
+            self._params = params
         else:
-            mol = rdMolStandardize.SuperParent(mol)
-        row[self.out_column] = mol
+            self._params = None
+        if self.cache_size:
+            self._cached_standardize = functools.lru_cache(maxsize=self.cache_size)(
+                self._standardize_smiles
+            )
+        else:
+            self._cached_standardize = None
+
+    def _standardize(self, mol: Chem.Mol) -> Chem.Mol:
+        mol = Chem.Mol(mol)  # C++ copy constructor, see RemoveStereoMol
+        if self._params is not None:
+            return rdMolStandardize.SuperParent(mol, params=self._params)
+        return rdMolStandardize.SuperParent(mol)
+
+    def _standardize_smiles(self, smiles: str) -> Chem.Mol:
+        return self._standardize(Chem.MolFromSmiles(smiles))
+
+    def _row_apply(self, row: pd.Series) -> pd.Series:
+        mol = row[self.in_column]
+        if self._cached_standardize is not None:
+            # Keyed on canonical SMILES, so structurally identical molecules
+            # reuse the standardization result
+            row[self.out_column] = self._cached_standardize(Chem.MolToSmiles(mol))
+        else:
+            row[self.out_column] = self._standardize(mol)
         return row
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from pdchemchain.base import (
+    Link,
     RowLink,
 )
 
@@ -21,15 +23,100 @@ class LinearModelRow(RowLink):
     in_column: InColumnName = "x"  # InColumnName is a special typehint, that will ensure that the dataframe is checked for existence of the column name before processing and giving adequate error information
     out_column: str = "y"
 
+    def _apply_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        # Full NumPy vectorization: the column is converted once with pd.to_numeric
+        # and the model is a single vector operation instead of a Python call per row
+        from pdchemchain.errormanager import rows_with_errors
+
+        x = pd.to_numeric(df[self.in_column], errors="coerce").to_numpy(
+            dtype=np.float64
+        )
+        skip_mask = np.array(rows_with_errors(df, aslist=True), dtype=bool)
+        # Only values that to_numeric coerced to NaN are errors; a genuine NaN
+        # input propagates to a NaN result without an error, like float(nan)
+        # does in the scalar path. The numpy-level self-inequality spots NaN
+        # but not None, so None in an object column still errors like
+        # float(None) would (pandas comparisons would lump the two together)
+        raw = df[self.in_column].to_numpy()
+        nan_input = np.asarray(raw != raw, dtype=bool)
+        error_mask = np.isnan(x) & ~nan_input & ~skip_mask
+        y = self.slope * x + self.bias
+
+        df = df.copy()
+        untouched_mask = skip_mask | error_mask
+        if untouched_mask.any():
+            out = np.asarray(y, dtype=object)
+            original = (
+                df[self.out_column].to_numpy()
+                if self.out_column in df.columns
+                else np.full(len(df), np.nan, dtype=object)
+            )
+            out[untouched_mask] = original[untouched_mask]
+            df[self.out_column] = pd.Series(out, index=df.index)
+        else:
+            df[self.out_column] = pd.Series(y, index=df.index)
+
+        if error_mask.any():
+            errors = pd.Series(
+                np.where(
+                    error_mask,
+                    f"Non-numeric value in column '{self.in_column}'",
+                    None,
+                ),
+                index=df.index,
+            )
+            df = self.append_errors(df, errors)
+        return df
+
+    def _row_apply_scalar(
+        self, x
+    ) -> float:  # Defining the scalar hook opts the link into the vectorized row engine
+        return self.slope * float(x) + self.bias  # for a little bit extra robustness we try and cast the value as a float
+
     def _row_apply(
         self, row: pd.Series
     ) -> pd.Series:  # For RowLink we overload the _row_apply function
-        x = float(
+        row[self.out_column] = self._row_apply_scalar(
             row[self.in_column]
-        )  # We simply index into the row with the column name, for a little bit extra robustness we try and cast the value as a float
-
-        row[self.out_column] = (
-            self.slope * x + self.bias
         )  # We simply assign the new value under the wanted column name
 
         return row  # We simply return the modified row
+
+
+@dataclass
+class LinearModelDf(Link):
+    """Example of a custom link working on the whole dataframe
+
+    Calculates y based on a slope and bias and values in x column, like LinearModelRow,
+    but vectorized: the column is converted once with pd.to_numeric and the model is a
+    single numpy vector operation instead of a Python call per row"""
+
+    slope: float
+    bias: float
+    in_column: InColumnName = "x"
+    out_column: str = "y"
+
+    def _apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        x = pd.to_numeric(
+            df[self.in_column], errors="coerce"
+        )  # Values that can't be interpreted as numbers become NaN instead of raising per row
+
+        df = df.copy()
+        df[self.out_column] = self.slope * x + self.bias
+
+        # Rows where the conversion failed are reported in the __error__ column
+        error_mask = df[self.out_column].isna()
+        if error_mask.any():
+            errors = pd.Series(
+                np.where(
+                    error_mask.to_numpy(),
+                    f"Non-numeric value in column '{self.in_column}'",
+                    None,
+                ),
+                index=df.index,
+            )
+            df = self.append_errors(df, errors)
+            self.logger.warning(
+                f"{int(error_mask.sum())} rows had non-numeric values in '{self.in_column}'"
+            )
+        return df
@@ -1,9 +1,10 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
-from pdchemchain.base import Link, RowLink
+from pdchemchain.base import COPY_ON_WRITE, Link, RowLink
 
 
 @dataclass
@@ -19,7 +20,9 @@ class DfEval(Link):
         Moreover, the eval is not error handled, so one row with wrong input will make the entire apply fail"""
         # TODO, figure out a way to do proper error handling, or at least not work on rows with anything in __error__
         if self.out_column:
-            df = df.copy()
+            # Under Copy-on-Write a shallow copy is enough, the column assignment
+            # below clones only the affected column instead of the whole frame
+            df = df.copy(deep=False) if COPY_ON_WRITE else df.copy()
             df[self.out_column] = df.eval(self.eval_str)
         else:
             df = df.eval(self.eval_str)
@@ -28,6 +31,42 @@ class DfEval(Link):
         return df
 
 
+@dataclass
+class NumexprLink(Link):
+    """Computes an arithmetic expression over columns via the numexpr engine
+
+    Like DfEval, but the expression is evaluated with engine='numexpr' when numexpr is
+    installed, which compiles elementwise arithmetic to threaded SIMD loops over the
+    column arrays instead of chained pandas operations. Falls back to the python engine
+    when numexpr is not available.
+
+    Parameters
+    ----------
+    expression
+        The arithmetic expression over column names, e.g. 'column_A / column_B'
+    out_column
+        The label for the column that should store the result
+    """
+
+    expression: str
+    out_column: str
+
+    def __post_init__(self):
+        super().__post_init__()
+        # The engine is selected once here rather than per apply call
+        from pandas.core.computation.check import NUMEXPR_INSTALLED
+
+        self._engine = "numexpr" if NUMEXPR_INSTALLED else "python"
+
+    def _apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        df[self.out_column] = df.eval(self.expression, engine=self._engine)
+        self.logger.debug(
+            f"Used {self.expression} expression on dataframe with {self._engine} engine"
+        )
+        return df
+
+
 @dataclass
 class DropColumns(Link):
     """Drops columns based on defined list of columns names"""
@@ -53,7 +92,18 @@ class DropDuplicates(Link):
 
     def _apply(self, df: pd.DataFrame) -> pd.DataFrame:
         if self.columns:
-            df_no_duplicates = df.drop_duplicates(subset=self.columns)
+            if len(self.columns) > 1:
+                # Multi-column fast path: one uint64 hash per row and np.unique,
+                # instead of letting drop_duplicates build a compound key column
+                # by column. Relies on the 64-bit row hashes not colliding, which
+                # is effectively certain below billions of rows
+                key = pd.util.hash_pandas_object(
+                    df[self.columns], index=False
+                ).to_numpy()
+                _, first_idx = np.unique(key, return_index=True)
+                df_no_duplicates = df.iloc[np.sort(first_idx)]
+            else:
+                df_no_duplicates = df.drop_duplicates(subset=self.columns)
             self.logger.debug(
                 f"Dropped {len(df)-len(df_no_duplicates)} duplicates. Rows remaining: {len(df_no_duplicates)}"
             )
@@ -137,9 +187,18 @@ class Query(Link):
 
     query: str = ""
 
+    def __post_init__(self):
+        super().__post_init__()
+        # pandas re-parses the query string on every call through its public API, but
+        # the engine selection can at least be hoisted out of the hot path. The numexpr
+        # engine compiles the expression to vectorized loops when numexpr is installed
+        from pandas.core.computation.check import NUMEXPR_INSTALLED
+
+        self._engine = "numexpr" if NUMEXPR_INSTALLED else "python"
+
     def _apply(self, df: pd.DataFrame) -> pd.DataFrame:
         if self.query:
-            df_query = df.query(self.query)
+            df_query = df.query(self.query, engine=self._engine)
             self.logger.debug(
                 f"Rows before query: {len(df)}, rows after query: {len(df_query)}"
             )
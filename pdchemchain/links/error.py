@@ -1,5 +1,6 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from pdchemchain.base import Link
@@ -16,7 +17,9 @@ class StripErrors(Link):
 
     def __post_init__(self):
         super().__post_init__()
-        self.error_df: pd.DataFrame = field(default_factory=pd.DataFrame)
+        # field() is a dataclass-definition-time construct, calling it here would
+        # store a Field sentinel and break .empty access in has_errors
+        self.error_df: pd.DataFrame = pd.DataFrame()
 
     @property
     def has_errors(self) -> bool:
@@ -24,10 +27,11 @@ class StripErrors(Link):
 
     def _apply(self, df: pd.DataFrame) -> pd.DataFrame:
         if "__error__" in df:
-            noerror_mask = df.__error__.isna()
-            error_df = df[~noerror_mask]
-            noerrors_df = df[noerror_mask]
-            noerrors_df = noerrors_df.drop(["__error__"], axis=1)
+            # One numpy bool mask and positional takes, instead of boolean-indexing
+            # the frame twice with a pandas Series and a separate drop pass
+            err_mask = df["__error__"].notna().to_numpy()
+            error_df = df.iloc[np.nonzero(err_mask)[0]]
+            noerrors_df = df.iloc[np.nonzero(~err_mask)[0]].drop(columns="__error__")
             self.logger.info(
                 f"Stripped {len(error_df)} rows with errors. Available for inspection in .error_df attribute."
             )
@@ -1,14 +1,57 @@
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from multiprocessing import Pool
+from multiprocessing import Pool, resource_tracker, shared_memory
 from typing import Optional
 
 import numpy as np
 import pandas as pd
 import psutil
 
-from pdchemchain.base import Link
+from pdchemchain.base import COPY_ON_WRITE, Link
+
+# Under Copy-on-Write pd.concat already defers copies (and the keyword is
+# deprecated in pandas 3); on older pandas without CoW, copy=False skips the
+# eager block copy of the concatenated result
+_CONCAT_KWARGS = {} if COPY_ON_WRITE else {"copy": False}
+
+
+def _blocks_to_df(parts):
+    """Join partitions sharing columns and numpy dtypes with per-column np.concatenate
+
+    Partitions produced from one dataframe normally have identical schemas, in
+    which case the pandas block-alignment machinery in pd.concat is pure
+    overhead and a plain np.concatenate per column is considerably faster.
+    Returns None when the schemas differ (or hold extension dtypes), so the
+    caller can fall back to pd.concat."""
+    first = parts[0]
+    columns = first.columns
+    dtypes = list(first.dtypes)
+    if not all(isinstance(dtype, np.dtype) for dtype in dtypes):
+        return None
+    for part in parts[1:]:
+        if not part.columns.equals(columns) or list(part.dtypes) != dtypes:
+            return None
+    data = {
+        column: np.concatenate([part[column].to_numpy() for part in parts])
+        for column in columns
+    }
+    return pd.DataFrame(data, copy=False)
+
+
+def _fast_concat(parts):
+    """Concatenate processed partitions into one dataframe
+
+    A single partition skips pd.concat entirely, which pays block consolidation
+    and copies every buffer even for one input. Homogeneous partitions are
+    joined column-wise with np.concatenate, the rest through pd.concat."""
+    if len(parts) == 1:
+        return parts[0].reset_index(drop=True)
+    result = _blocks_to_df(parts)
+    if result is not None:
+        return result
+    return pd.concat(parts, ignore_index=True, **_CONCAT_KWARGS)
 
 
 @dataclass(kw_only=True)
@@ -42,54 +85,207 @@ class PartitionProcessorBase(Link):
             raise ValueError("Specify either 'partition_size' or 'num_partitions'.")
         return partitions
 
+    @staticmethod
+    def _split(dataframe, num_partitions):
+        """Split into contiguous iloc slices of near-equal size
+
+        Unlike np.array_split on a DataFrame (which fancy-indexes new frames,
+        and returns bare ndarrays under numpy 2), contiguous iloc slicing
+        produces dataframe views without copying the underlying blocks."""
+        bounds = np.linspace(0, len(dataframe), num_partitions + 1, dtype=np.int64)
+        return [
+            dataframe.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+
     def _partition_by_size(self, dataframe):
-        return np.array_split(dataframe, len(dataframe) // self.partition_size + 1)
+        num_partitions = max(1, -(-len(dataframe) // self.partition_size))  # ceil
+        return self._split(dataframe, num_partitions)
 
     def _partition_by_num(self, dataframe):
-        return np.array_split(dataframe, self.num_partitions)
+        return self._split(dataframe, self.num_partitions)
 
 
-class SafePoolLinkMapper:
-    def __init__(self, link: Link):
-        self.config = link.get_params()  # can safely and efficiently transport the config to threads/processes as text only
+_WORKER_LINK = None  # Link instance rebuilt once per worker process, see _init_worker
+
+
+def _init_worker(config):
+    """Pool initializer: rebuild the Link from its config once per worker
+
+    Rebuilding in the initializer instead of per task means expensive
+    construction (e.g. a ScikitMol model pickle.load) happens once per worker
+    process rather than once per partition."""
+    global _WORKER_LINK
+    logging.basicConfig(
+        format="%(asctime)s - %(levelname)s - [Process %(process)d] - %(name)s: %(message)s"
+    )
+    _WORKER_LINK = Link.from_params(config)
+    _WORKER_LINK.logger.debug(f"Initialized worker process {os.getpid()}")
+
+
+def _process_partition(indexed_df):
+    """Run the worker's Link on an (index, dataframe) pair, keeping the index tag"""
+    index, df = indexed_df
+    return index, _WORKER_LINK(df)
+
+
+def _partition_to_shm(df):
+    """Serialize a partition into a shared-memory block as an Arrow IPC stream
+
+    Returns None when the frame does not convert to Arrow (e.g. columns holding
+    RDKit Mol objects), in which case the caller falls back to pickling the
+    partition to the worker."""
+    import pyarrow as pa
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    buf = sink.getvalue()
+    shm = shared_memory.SharedMemory(create=True, size=len(buf))
+    shm.buf[: len(buf)] = memoryview(buf).cast("B")
+    return shm, len(buf)
 
-    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
-        logging.basicConfig(
-            format="%(asctime)s - %(levelname)s - [Process %(process)d] - %(name)s: %(message)s"
-        )
-        link = Link.from_params(
-            self.config
-        )  # Link recreated from config in the thread/process
-        process_id = os.getpid()
-        link.logger.debug(f"Starting process {process_id}")
-        return link(df)
+
+def _process_shm_partition(task):
+    """Rebuild a partition from a shared-memory Arrow stream and run the worker's Link"""
+    import pyarrow as pa
+
+    index, name, size = task
+    shm = shared_memory.SharedMemory(name=name)
+    # Attaching registers the segment with this process' resource tracker as if
+    # it were the owner; unregister it, the parent owns and unlinks the block
+    # (see cpython issue bpo-39959)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    try:
+        # The stream is copied out of the block before closing; a zero-copy read
+        # could leave the Arrow buffers pointing into the closed mapping
+        data = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+    df = pa.ipc.open_stream(data).read_all().to_pandas()
+    return index, _WORKER_LINK(df)
 
 
 @dataclass
 class ParallelPartitionProcessor(PartitionProcessorBase):
     """Process dataframe in parallel on several processors
 
-    Partitions the dataframe into chunks and uses Pool.map to process them in parallel and concatenate the result"""
+    Partitions the dataframe into chunks and uses Pool.map to process them in parallel and concatenate the result
+
+    The default 'process' backend isolates workers in separate processes at the
+    cost of pickling every partition to the worker and the result back. The
+    'thread' backend runs the live link in a thread pool with no pickling at
+    all; it parallelizes well when the inner link spends its time in C code
+    that releases the GIL (RDKit, numpy, scikit-learn predict), but pure-Python
+    links will serialize on the GIL."""
 
     link: Link
     num_processes: int = psutil.cpu_count(logical=False)
+    backend: str = "process"
+    use_shared_memory: bool = False
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.backend not in ("process", "thread"):
+            raise ValueError(
+                f"Unknown backend {self.backend!r}, expected 'process' or 'thread'."
+            )
+        if self.use_shared_memory:
+            from pdchemchain.utilities import assert_import_dependency
+
+            assert_import_dependency("pyarrow")
+
+    def _thread_apply(self, partitions):
+        """Process the partitions with the live link in a thread pool
+
+        Threads share memory with the parent, so the partitions stay zero-copy
+        views and neither the link config nor the dataframes are pickled."""
+        self.logger.debug(
+            f"Will process partitions in {self.num_processes} parallel threads"
+        )
+        with ThreadPoolExecutor(max_workers=self.num_processes) as executor:
+            return list(executor.map(self.link, partitions))
+
+    def _shm_apply(self, partitions):
+        """Pass partitions to the process pool through shared memory
+
+        Each partition is written once as an Arrow IPC stream into a shared
+        memory block and only the block descriptor is pickled to the worker,
+        removing the input-side pickle of the full frame. Partitions that do
+        not convert to Arrow (object columns such as RDKit Mols) fall back to
+        the pickling task. Results still return pickled."""
+        config = self.link.get_params()
+        self.logger.debug(
+            f"Will process partitions in {self.num_processes} parallel processes via shared memory"
+        )
+        results = [None] * len(partitions)
+        shm_blocks = []
+        with Pool(
+            self.num_processes, initializer=_init_worker, initargs=(config,)
+        ) as pool:
+            try:
+                pending = []
+                for index, partition in enumerate(partitions):
+                    packed = _partition_to_shm(partition)
+                    if packed is None:
+                        self.logger.debug(
+                            f"Partition {index} does not convert to Arrow, pickling it instead"
+                        )
+                        pending.append(
+                            pool.apply_async(_process_partition, ((index, partition),))
+                        )
+                    else:
+                        shm, size = packed
+                        shm_blocks.append(shm)
+                        pending.append(
+                            pool.apply_async(
+                                _process_shm_partition, ((index, shm.name, size),)
+                            )
+                        )
+                for result in pending:
+                    index, processed = result.get()
+                    results[index] = processed
+            finally:
+                for shm in shm_blocks:
+                    shm.close()
+                    shm.unlink()
+        return results
 
     def _apply(self, dataframe):
         partitions = self._partition(dataframe)
 
-        safemapper = SafePoolLinkMapper(self.link)
+        if self.backend == "thread":
+            return _fast_concat(self._thread_apply(partitions))
+        if self.use_shared_memory:
+            return _fast_concat(self._shm_apply(partitions))
 
-        # Initialize a multiprocessing pool
-        with Pool(self.num_processes) as pool:
-            # Process each chunk using the multiprocessing pool
+        # Only the config travels to the pool; each worker rebuilds the Link once
+        # in its initializer instead of once per partition
+        config = self.link.get_params()
+        with Pool(
+            self.num_processes, initializer=_init_worker, initargs=(config,)
+        ) as pool:
+            # Process each chunk using the multiprocessing pool. imap_unordered
+            # with a tuned chunksize amortizes the per-task pickling overhead and
+            # lets results stream back as workers finish; the index tags restore
+            # the original partition order
             self.logger.debug(
                 f"Will process partitions in {self.num_processes} parallel processes"
             )
-            partitions = pool.map(safemapper.apply, partitions)
+            chunksize = max(1, len(partitions) // (self.num_processes * 4))
+            results = [None] * len(partitions)
+            for index, processed in pool.imap_unordered(
+                _process_partition, list(enumerate(partitions)), chunksize=chunksize
+            ):
+                results[index] = processed
+            partitions = results
 
         # Process each partition using the supplied function and concatenate the processed partitions into the final DataFrame
         self.logger.debug("Joining processed partition to one dataframe")
-        result_dataframe = pd.concat(partitions, ignore_index=True)
+        result_dataframe = _fast_concat(partitions)
 
         return result_dataframe
 
@@ -105,11 +301,17 @@ class SerialPartitionProcessor(PartitionProcessorBase):
 
     def _apply(self, dataframe):
         partitions = self._partition(dataframe)
+        num_partitions = len(partitions)
         # Process each partition using the supplied Link or Chain and concatenate the processed partitions into the final DataFrame
         self.logger.debug("Processing partitions one by one")
-        # TODO make a loop that pops from partitions, and append to processed partition list. Can maybe save memory, and allow for better logging
-        result_dataframe = pd.concat(
-            [self.link(partition) for partition in partitions], ignore_index=True
-        )
+        # Popping each partition frees its input before the next one is processed,
+        # so at most one unprocessed/processed pair is alive on top of the lists
+        processed = []
+        while partitions:
+            partition = partitions.pop(0)
+            processed.append(self.link(partition))
+            self.logger.debug(
+                f"Processed partition {len(processed)} of {num_partitions}"
+            )
         self.logger.debug("Done processing partitions, join to a single dataframe")
-        return result_dataframe
+        return _fast_concat(processed)
@@ -0,0 +1,54 @@
+"""Optional Numba-accelerated links
+
+Not re-exported from pdchemchain.links, as numba is an optional dependency
+(import pdchemchain.links.numba explicitly, like pdchemchain.links.model)."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from pdchemchain.base import Link
+from pdchemchain.typing import InColumnName
+from pdchemchain.utilities import assert_import_dependency
+
+
+@dataclass
+class NumbaRowLink(Link, ABC):
+    """Base class for links with a pure numeric per-row computation compiled by Numba
+
+    Subclasses define a _kernel staticmethod decorated with @njit that fills a
+    preallocated output array from the input array, e.g.::
+
+        @staticmethod
+        @njit(cache=True, parallel=True)
+        def _kernel(x_arr, out_arr):
+            for i in prange(x_arr.shape[0]):
+                out_arr[i] = 2.0 * x_arr[i] + 1.0
+
+    _apply extracts the in_column as a contiguous float64 array, allocates the
+    output and invokes the kernel, so the whole loop runs as machine code with
+    no Python frame per row. Only suitable for columns that convert cleanly to
+    floats; non-numeric values raise rather than being error-handled per row.
+    """
+
+    in_column: InColumnName = "x"
+    out_column: str = "y"
+
+    def __post_init__(self):
+        super().__post_init__()
+        assert_import_dependency("numba")
+
+    @staticmethod
+    @abstractmethod
+    def _kernel(x_arr: np.ndarray, out_arr: np.ndarray) -> None:
+        """Fill out_arr from x_arr. Decorate with numba.njit in subclasses"""
+
+    def _apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        x_arr = np.ascontiguousarray(df[self.in_column].to_numpy(dtype=np.float64))
+        out_arr = np.empty(len(df), dtype=np.float64)
+        self._kernel(x_arr, out_arr)
+        df = df.copy()
+        df[self.out_column] = out_arr
+        return df
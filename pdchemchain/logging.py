@@ -10,6 +10,14 @@ logging.basicConfig(
 
 logger = logging.getLogger("pdchemchain.logging")
 
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 
 class RowLogger:
     """Logger for pandas.Series named 'row' in the call stack or supplied as argument.
@@ -18,48 +26,48 @@ class RowLogger:
 
     def __init__(self, parent):
         self.parent = parent
+        self._effective_level = None
+
+    def invalidate_level_cache(self):
+        """Forget the cached effective level, call after changing the parent logger's level"""
+        self._effective_level = None
 
     def _log(self, row: pd.Series, message: str, level: str) -> pd.Series:
-        log_levels = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL,
-        }
-        current_level = self.parent.logger.getEffectiveLevel()
-        message_level = log_levels[level.upper()]
-
-        if message_level >= current_level:
-            log_column = "__log__"
-            return self.parent._create_or_append(
-                row, f"{level}: {message}", column_name=log_column
+        # getEffectiveLevel walks the logger hierarchy, so the result is cached
+        # between calls and invalidated by set_log_level on the parent Link
+        current_level = self._effective_level
+        if current_level is None:
+            current_level = self._effective_level = (
+                self.parent.logger.getEffectiveLevel()
             )
-        return row
+        message_level = LOG_LEVELS[level]
+
+        if message_level < current_level:
+            # Filtered messages return before the row is resolved, so the
+            # expensive call-stack walk in _get_outer_row only runs for
+            # messages that will actually be logged
+            return row
 
-    def debug(self, message: str, row: pd.Series = None):
         if row is None:
             row = self._get_outer_row()
+        log_column = "__log__"
+        return self.parent._create_or_append(
+            row, f"{level}: {message}", column_name=log_column
+        )
+
+    def debug(self, message: str, row: pd.Series = None):
         return self._log(row, message, "DEBUG")
 
     def info(self, message: str, row: pd.Series = None):
-        if row is None:
-            row = self._get_outer_row()
         return self._log(row, message, "INFO")
 
     def warning(self, message: str, row: pd.Series = None):
-        if row is None:
-            row = self._get_outer_row()
         return self._log(row, message, "WARNING")
 
     def error(self, message: str, row: pd.Series = None):
-        if row is None:
-            row = self._get_outer_row()
         return self._log(row, message, "ERROR")
 
     def critical(self, message: str, row: pd.Series = None):
-        if row is None:
-            row = self._get_outer_row()
         return self._log(row, message, "CRITICAL")
 
     def _get_outer_row(self) -> pd.Series:
@@ -1,3 +1,6 @@
+import os
+import sys
+
 import click
 import pandas as pd
 
@@ -12,6 +15,9 @@ def pdchemchain():
     pass
 
 
+_IMPORTED_PATHS = set()  # (path, mtime) pairs already executed into this scope
+
+
 def import_all_from_path(file_path: str) -> None:
     """
     Import all contents from a Python file into the current __main__ scope.
@@ -32,9 +38,58 @@ def import_all_from_path(file_path: str) -> None:
     print(result)
     ```
     """
+    # Memoized by path and mtime: the file was already read, compiled and
+    # executed into this scope, so a repeat call (e.g. persistent mode or
+    # repeated process_data calls in one process) has nothing left to do.
+    # An edited file gets a new mtime and is executed again
+    key = (file_path, os.path.getmtime(file_path))
+    if key in _IMPORTED_PATHS:
+        return
     with open(file_path, "rb") as file:
         code = compile(file.read(), file_path, "exec")
         exec(code, globals())
+    _IMPORTED_PATHS.add(key)
+
+
+def _process_file(
+    chain,
+    in_file,
+    out_file,
+    error_file,
+    pd_read_options,
+    pd_write_options,
+    append_errors=False,
+):
+    """Run a prebuilt chain on one input/output file pair
+
+    Returns True if error rows were written to error_file"""
+    df = pd.DataFrame()
+
+    if in_file:
+        read_file = FromFile(in_file, pd_readcsv_options=pd_read_options)
+        df = read_file(df)
+
+    df = chain(df)
+
+    wrote_errors = False
+    if error_file:
+        strip = StripErrors()
+        df = strip(df)
+        if not strip.error_df.empty:
+            logger.warning(
+                f"{len(strip.error_df)} rows with errors found after processing, saving to {error_file}"
+            )
+            if append_errors:
+                strip.error_df.to_csv(error_file, mode="a", header=False)
+            else:
+                strip.error_df.to_csv(error_file)
+            wrote_errors = True
+
+    if out_file:
+        write_file = ToFile(out_file, pd_tocsv_options=pd_write_options)
+        write_file(df)
+
+    return wrote_errors
 
 
 def process_data(
@@ -47,6 +102,7 @@ def process_data(
     custom_links,
     pd_read_options,
     pd_write_options,
+    persistent=False,
 ):
     if pd_read_options:
         logger.info("Parsing options for csv reading.")
@@ -71,26 +127,40 @@ def process_data(
     if debug_level:
         chain.set_log_level(debug_level)
 
-    df = pd.DataFrame()
-
-    if in_file:
-        read_file = FromFile(in_file, pd_readcsv_options=pd_read_options)
-        df = read_file(df)
-
-    df = chain(df)
-
-    if error_file:
-        strip = StripErrors()
-        df = strip(df)
-        if not strip.error_df.empty:
-            logger.warning(
-                f"{len(strip.has_errors)} rows with errors found after processing, saving to {error_file}"
+    if persistent:
+        # Chain construction (and e.g. unpickling of models therein) happened
+        # once above; each stdin line is processed with the same live chain
+        logger.info(
+            "Persistent mode, reading 'in_file out_file' pairs from stdin (empty line or EOF quits)"
+        )
+        # The first pair with errors (over)writes error_file with a header,
+        # later pairs append, so one session collects all its error rows
+        # instead of each pair overwriting the previous one
+        error_file_started = False
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                break
+            filenames = line.split()
+            if len(filenames) != 2:
+                logger.error(
+                    f"Expected 'in_file out_file' pair, got {line!r}, skipping"
+                )
+                continue
+            wrote_errors = _process_file(
+                chain,
+                filenames[0],
+                filenames[1],
+                error_file,
+                pd_read_options,
+                pd_write_options,
+                append_errors=error_file_started,
             )
-            strip.error_df.to_csv(error_file)
-
-    if out_file:
-        write_file = ToFile(out_file, pd_tocsv_options=pd_write_options)
-        write_file(df)
+            error_file_started = error_file_started or wrote_errors
+    else:
+        _process_file(
+            chain, in_file, out_file, error_file, pd_read_options, pd_write_options
+        )
 
 
 @pdchemchain.command()
@@ -135,6 +205,12 @@ def process_data(
     default=None,
     help="Extra options for Pandas to_csv() written as single keyword=value. Multiple options can be set by using --pd_write_option multiple times.",
 )
+@click.option(
+    "--persistent",
+    is_flag=True,
+    default=False,
+    help="Build the chain once, then read 'in_file out_file' pairs from stdin and process them with the same chain. Empty line or EOF quits.",
+)
 def run(
     config_file,
     in_file,
@@ -145,6 +221,7 @@ def run(
     custom_links,
     pd_read_option,
     pd_write_option,
+    persistent,
 ):
     """CONFIG_FILE: the json/yaml file with the specification for the pdchemchain chain or link."""
     process_data(
@@ -157,6 +234,7 @@ def run(
         custom_links,
         pd_read_option,
         pd_write_option,
+        persistent,
     )
 
 
@@ -1,3 +1,4 @@
+import functools
 import inspect
 
 import pandas as pd
@@ -5,36 +6,58 @@ import pandas as pd
 from pdchemchain import Link, links
 
 
+def _get_class_info(cls):
+    info = {}
+    if cls:
+        if cls.__doc__:
+            info["Tooltip"] = cls.__doc__.split("\n")[0]
+        # inspect.signature walks __init__ and builds Parameter objects on every
+        # call; the formatted API string is cached on the class. Looked up via
+        # cls.__dict__ so a subclass does not inherit its parent's string
+        api = cls.__dict__.get("__pdchem_api__")
+        if api is None:
+            api = cls.__name__ + str(inspect.signature(cls)).replace(" -> None", "")
+            cls.__pdchem_api__ = api
+        info["Api"] = api
+        info["Klass"] = cls
+    return info
+
+
+@functools.lru_cache(maxsize=1)
+def _builtin_class_df():
+    """Builds the dataframe of built-in Link classes, once per process
+
+    Scanning the links package with inspect.getmembers and assembling the
+    dataframe is identical on every run, so the result is cached and shared
+    between LinkToolbox instances (notebooks and the CLI construct toolboxes
+    repeatedly). The records are built row-wise to skip the transpose and
+    dtype re-inference that pd.DataFrame(dict).T paid."""
+    class_tuples = inspect.getmembers(
+        links, lambda cls: inspect.isclass(cls) and issubclass(cls, Link)
+    )
+    records = [_get_class_info(class_tuple[1]) for class_tuple in class_tuples]
+    index = pd.MultiIndex.from_tuples(
+        [
+            (cls.__module__.split(".")[-1], cls.__name__)
+            for _, cls in class_tuples
+        ],
+        names=["Module", "Class"],
+    )
+    return pd.DataFrame.from_records(records, index=index).sort_index()
+
+
 class LinkToolbox:
     """Toolbox with information and references to all link classes"""
 
     def __init__(self):
-        class_tuples = inspect.getmembers(
-            links, lambda cls: inspect.isclass(cls) and issubclass(cls, Link)
-        )
-        classes = [class_tuple[1] for class_tuple in class_tuples]
-        self._parse_classes(classes)
+        self.class_df = _builtin_class_df().copy(deep=False)
         self.register_main_scope_links()
 
-    def _get_class_info(self, cls):
-        info = {}
-        if cls:
-            if cls.__doc__:
-                info["Tooltip"] = cls.__doc__.split("\n")[0]
-            info["Api"] = cls.__name__ + str(inspect.signature(cls)).replace(
-                " -> None", ""
-            )
-            info["Klass"] = cls
-        return info
-
-    def _parse_classes(self, classes):
-        class_dict = {}
-        for cls in classes:
-            compound_key = (cls.__module__.split(".")[-1], cls.__name__)
-            class_dict[compound_key] = self._get_class_info(cls)
-        class_df = pd.DataFrame(class_dict).T
-        class_df.index.names = ["Module", "Class"]
-        self.class_df = class_df.sort_index()
+    def refresh(self):
+        """Rescan the links package and the __main__ scope for Link classes"""
+        _builtin_class_df.cache_clear()
+        self.class_df = _builtin_class_df().copy(deep=False)
+        self.register_main_scope_links()
 
     def __repr__(self):
         return repr(self.class_df)
@@ -63,7 +86,7 @@ class LinkToolbox:
 
     def register_class(self, cls):
         self.class_df.loc[(cls.__module__.split(".")[-1], cls.__name__), :] = (
-            self._get_class_info(cls)
+            _get_class_info(cls)
         )
 
     def register_main_scope_links(self):
@@ -0,0 +1,36 @@
+"""Shared helpers for batched and memoized RDKit calls in the test fixtures"""
+
+import functools
+
+from rdkit import Chem
+
+
+def batch_parse(smiles_list):
+    """Parse a list of SMILES into Mol objects with a single supplier call
+
+    One SmilesMolSupplierFromText call parses the whole batch inside RDKit
+    instead of paying a Python-level Chem.MolFromSmiles call per string. This
+    supplier preserves input order, unlike the multithreaded variant. Beware
+    that len() on the supplier seeks its stream to the end, so it must be
+    iterated directly and never passed to list().
+    """
+    text = "\n".join(f"{smiles}\t." for smiles in smiles_list)
+    supplier = Chem.SmilesMolSupplierFromText(
+        text, delimiter="\t", smilesColumn=0, nameColumn=1, titleLine=False
+    )
+    return [mol for mol in supplier]
+
+
+@functools.lru_cache(maxsize=128)
+def _canon_cached(mol_id, mol):
+    return Chem.MolToSmiles(mol)
+
+
+def canonical_smiles(mol):
+    """Memoized Chem.MolToSmiles, keyed by object identity
+
+    Assertions that canonicalize the same cached fixture Mol in several tests
+    pay the C++ canonicalization only once. The id() key avoids relying on Mol
+    hashing semantics; it is only valid while the Mol is alive, which holds for
+    the module-constant fixture Mols this is used with."""
+    return _canon_cached(id(mol), mol)
@@ -37,6 +37,18 @@ class BaseTest:
     def link(self, LinkClass, classparams) -> Link:
         return LinkClass(**classparams)
 
+    # Class-scoped variant for stateless links: one instance drives all tests
+    # in the class instead of being reconstructed per test function. Built from
+    # the class attributes since class-scoped fixtures cannot request the
+    # function-scoped classparams. Opt in per subclass with
+    #     @pytest.fixture
+    #     def link(self, link_cached):
+    #         return link_cached
+    @pytest.fixture(scope="class")
+    @classmethod
+    def link_cached(cls) -> Link:
+        return cls._Link(**copy.deepcopy(cls._classparams))
+
     def test_return_dataframe(self, link, sample_dataframe):
         result = link(sample_dataframe)
         assert isinstance(result, pd.DataFrame)
@@ -2,27 +2,39 @@ import pytest
 import pandas as pd
 
 from pdchemchain.links.dataframe import NullLink
-from rdkit import Chem
 
+from tests._smiles_batch import batch_parse
 
-@pytest.fixture
-def sample_dataframe() -> pd.DataFrame:
+
+# The test classes are independent, so the suite parallelizes well with
+# pytest-xdist: run 'pytest -n auto --dist loadfile' to keep each file's tests
+# on one worker. The session fixtures below are then built once per worker,
+# which is cheap enough that no cross-worker cache is needed
+
+
+@pytest.fixture(scope="session")
+def _sample_df_master() -> pd.DataFrame:
+    # Built (and the SMILES parsed) once per session; tests get copies below
     return pd.DataFrame(
         {
             "int1": [1, 2, 3],
             "int2": [2, 3, 4],
             "letters1": ["a", "b", "c"],
             "duplicates": [1, 2, 1],
-            "ROMol": [
-                Chem.MolFromSmiles("C"),
-                Chem.MolFromSmiles("CN"),
-                Chem.MolFromSmiles("OCN"),
-            ],
+            "ROMol": batch_parse(["C", "CN", "OCN"]),
             "Smiles": ["C", "CN", "OCN"],
         },
     )
 
 
+@pytest.fixture
+def sample_dataframe(_sample_df_master) -> pd.DataFrame:
+    # A shallow copy shares the column buffers with the master; under
+    # Copy-on-Write any mutation through the copy clones only the touched
+    # column, so tests still cannot contaminate each other
+    return _sample_df_master.copy(deep=False)
+
+
 @pytest.fixture
 def testlink():
     return NullLink(name="test1")
@@ -40,11 +52,7 @@ def csv_filename(tmp_path_factory):
             "int1": [1, 2, 1],
             "int2": [2, 3, 4],
             "letters1": ["a", "b", "c"],
-            "ROMol": [
-                Chem.MolFromSmiles("C"),
-                Chem.MolFromSmiles("CN"),
-                Chem.MolFromSmiles("OCN"),
-            ],
+            "ROMol": batch_parse(["C", "CN", "OCN"]),
             "Smiles": ["C", "CN", "OCN"],
         },
     )  # For some reason, cant access a function scoped fixture from a session scoped fixture, and cant make the sample_dataframe session scoped
@@ -1,3 +1,7 @@
+import numpy as np
+import pandas as pd
+
+from pdchemchain.errormanager import rows_with_errors
 from pdchemchain.links import MolFromSmiles
 from ...basetest import BaseErrorTest
 import pytest
@@ -9,12 +13,38 @@ class TestMolFromSmiles(BaseErrorTest):
     _classparams = {"in_column": "Smiles", "out_column": "MolFromSmiles"}
     _alt_classparams = {"in_column": "Smiles2", "out_column": "MolFromSmiles2"}
 
+    # MolFromSmiles is stateless, so the same instance drives all tests
+    @pytest.fixture
+    def link(self, link_cached):
+        return link_cached
+
     def test_molfromsmiles(self, link, sample_dataframe):
         df_o = link(sample_dataframe)
         assert "MolFromSmiles" in df_o
 
-        type_is_correct = []
-        for mol in df_o.MolFromSmiles:
-            type_is_correct.append(isinstance(mol, Chem.Mol))
+        # The bool mask is built straight into a packed numpy buffer, so the
+        # reduction is a C loop rather than an iteration over boxed bools
+        mask = np.fromiter(
+            (isinstance(mol, Chem.Mol) for mol in df_o.MolFromSmiles.values),
+            dtype=bool,
+            count=len(df_o),
+        )
+        assert mask.all()
+
+    def test_cache_hit_shares_mol(self):
+        link = MolFromSmiles(
+            in_column="Smiles", out_column="MolFromSmiles", cache_size=32
+        )
+        df_o = link(pd.DataFrame({"Smiles": ["CCO", "CCO", "C"]}))
+        assert link._cached_parse.cache_info().hits == 1
+        # A cache hit hands the same Mol object to both rows, as documented
+        assert df_o.MolFromSmiles.values[0] is df_o.MolFromSmiles.values[1]
+        assert isinstance(df_o.MolFromSmiles.values[2], Chem.Mol)
 
-        assert all(type_is_correct)
+    def test_cached_parse_failure_errors_per_row(self):
+        link = MolFromSmiles(
+            in_column="Smiles", out_column="MolFromSmiles", cache_size=32
+        )
+        # The second bad SMILES is served from the cache and must still error
+        df_o = link(pd.DataFrame({"Smiles": ["ImNotASmiles", "ImNotASmiles", "C"]}))
+        assert rows_with_errors(df_o, aslist=True) == [True, True, False]
@@ -1,7 +1,8 @@
+import numpy as np
+
 from pdchemchain.links import MolToSmiles
 from ...basetest import BaseErrorTest
 import pytest
-from rdkit import Chem
 
 
 class TestMolToSmiles(BaseErrorTest):
@@ -9,12 +10,18 @@ class TestMolToSmiles(BaseErrorTest):
     _classparams = {"in_column": "ROMol", "out_column": "MolToSmiles"}
     _alt_classparams = {"in_column": "ROMol2", "out_column": "MolToSmiles2"}
 
+    # MolToSmiles is stateless, so the same instance drives all tests
+    @pytest.fixture
+    def link(self, link_cached):
+        return link_cached
+
     def test_moltosmiles(self, link, sample_dataframe):
         df_o = link(sample_dataframe)
         assert "MolToSmiles" in df_o
 
-        type_is_correct = []
-        for smiles in df_o.MolToSmiles:
-            type_is_correct.append(isinstance(smiles, str))
-
-        assert all(type_is_correct)
+        mask = np.fromiter(
+            (isinstance(smiles, str) for smiles in df_o.MolToSmiles.values),
+            dtype=bool,
+            count=len(df_o),
+        )
+        assert mask.all()
@@ -1,6 +1,7 @@
+import numpy as np
+
 from pdchemchain.links import PandasAddMoleculeColumn
 from ...basetest import BaseTest
-import pytest
 from rdkit import Chem
 
 
@@ -21,8 +22,9 @@ class TestPandasAddMoleculeColumn(BaseTest):
         df_o = link(sample_dataframe)
         assert "PandasAddMoleculeColumn" in df_o
 
-        type_is_correct = []
-        for mol in df_o.PandasAddMoleculeColumn:
-            type_is_correct.append(isinstance(mol, Chem.Mol))
-
-        assert all(type_is_correct)
+        mask = np.fromiter(
+            (isinstance(mol, Chem.Mol) for mol in df_o.PandasAddMoleculeColumn.values),
+            dtype=bool,
+            count=len(df_o),
+        )
+        assert mask.all()
@@ -1,20 +1,26 @@
 import pandas as pd
 from pdchemchain.links import RemoveStereoMol
 from ...basetest import BaseErrorTest
+from ..._smiles_batch import batch_parse, canonical_smiles
 import pytest
 from rdkit import Chem
 
+# Parsed once at import; the module-scoped fixture hands out shallow copies.
+# The link copies the Mol before stripping stereo, so the cached Mol is never
+# mutated between tests
+_STEREO_DF = pd.DataFrame({"ROMol": batch_parse(["C[C@](N)(O)Cl"])})
+
 
 class TestRemoveStereoMol(BaseErrorTest):
     _Link = RemoveStereoMol
     _classparams = {"in_column": "ROMol", "out_column": "ROMol"}
     _alt_classparams = {"in_column": "ROMol2", "out_column": "ROMol2"}
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_dataframe(self):
-        return pd.DataFrame({"ROMol": [Chem.MolFromSmiles("C[C@](N)(O)Cl")]})
+        return _STEREO_DF.copy(deep=False)
 
     def test_removestereomol(self, link, sample_dataframe):
         df_o = link(sample_dataframe)
-        assert "@" in Chem.MolToSmiles(sample_dataframe.ROMol.iloc[0])
+        assert "@" in canonical_smiles(sample_dataframe.ROMol.iloc[0])
         assert "@" not in Chem.MolToSmiles(df_o.ROMol.iloc[0])
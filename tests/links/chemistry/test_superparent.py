@@ -1,8 +1,8 @@
 import pandas as pd
+from rdkit import Chem
+
 from pdchemchain.links import SuperParent
 from ...basetest import BaseErrorTest
-import pytest
-from rdkit import Chem
 
 
 class TestSuperParent(BaseErrorTest):
@@ -18,3 +18,14 @@ class TestSuperParent(BaseErrorTest):
     def test_removestereosmiles(self, link, sample_dataframe):
         df_o = link(sample_dataframe)
         assert "ROMol2" in df_o
+
+    def test_cache_hit_shares_mol(self):
+        link = SuperParent(in_column="ROMol", out_column="ROMol2", cache_size=32)
+        # Different input Mol objects for the same structure: the second row is
+        # a cache hit keyed on canonical SMILES
+        mols = [Chem.MolFromSmiles("CC(=O)O.[Na]"), Chem.MolFromSmiles("CC(=O)O.[Na]")]
+        df_o = link(pd.DataFrame({"ROMol": mols}))
+        assert link._cached_standardize.cache_info().hits == 1
+        # Cache hits share the standardized Mol object between rows, as documented
+        assert df_o.ROMol2.values[0] is df_o.ROMol2.values[1]
+        assert Chem.MolToSmiles(df_o.ROMol2.values[0]) == "CC(=O)O"
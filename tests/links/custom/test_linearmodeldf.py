@@ -0,0 +1,18 @@
+from pdchemchain.links.custom import LinearModelDf
+
+from ...basetest import BaseErrorTest
+
+import pandas as pd
+
+
+class TestLinearModelDf(BaseErrorTest):
+    _Link = LinearModelDf
+    _classparams = {"slope": 1, "bias": 2, "in_column": "int1", "out_column": "y"}
+    _alt_classparams = {"slope": 2, "bias": 1, "in_column": "int2", "out_column": "y2"}
+
+    _error_dataframe = pd.DataFrame({"int1": [1, 2, 3, None, "ImNotANumber", "BAD"]})
+    _expected_errors = [False, False, False, True, True, True]
+
+    def test_calculation(self, link, sample_dataframe):
+        df_o = link(sample_dataframe)
+        assert list(df_o.y.values) == [3.0, 4.0, 5.0]
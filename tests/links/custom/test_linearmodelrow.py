@@ -34,8 +34,18 @@ class TestLinerModelRow(BaseErrorTest):
     def test_calculation(
         self, link, sample_dataframe
     ):  # The fixtures with the link (from BaseTest) and sampledateframe (from conftest.py) are created and provided
+        # assert_series_equal compares the column buffer in C instead of boxing
+        # every value into a Python list first.
+        # We check that [1,2,3] turns into [3.,4.,5.] with a slope 1 and bias 2 from the _class_params above
         df_o = link(sample_dataframe)
-        ys = list(df_o.y.values)  # We cast as a list for the assert to work
-        assert (
-            ys == [3.0, 4.0, 5.0]
-        )  # We check that [1,2,3] turns into [3.,4.,5.] with a slope 1 and bias 2 from the _class_params above
+        pd.testing.assert_series_equal(
+            df_o.y, pd.Series([3.0, 4.0, 5.0], name="y"), check_dtype=False
+        )
+
+    def test_nan_propagates_without_error(self, link):
+        # A missing value gives a NaN result, not an __error__ row
+        df_o = link(pd.DataFrame({"int1": [1.0, float("nan"), 3.0]}))
+        assert "__error__" not in df_o.columns
+        pd.testing.assert_series_equal(
+            df_o.y, pd.Series([3.0, float("nan"), 5.0], name="y"), check_dtype=False
+        )
@@ -1,3 +1,7 @@
+import copy
+
+import pytest
+
 from pdchemchain.links import DfEval
 
 from ...basetest import BaseTest as BaseTest
@@ -8,12 +12,13 @@ class TestDfEval(BaseTest):
     _classparams = {"eval_str": "int1 + int2", "out_column": "int3"}
     _alt_classparams = {"eval_str": "int1 - int2", "out_column": "int4"}
 
-
-class TestDfEval_nooutcolumn(BaseTest):
-    _Link = DfEval
-    _classparams = {
-        "eval_str": "int3 = int1 + int2",
-    }
-    _alt_classparams = {
-        "eval_str": "int4 = int1 - int2",
-    }
+    # One parametrized class replaces the former TestDfEval/-nooutcolumn pair,
+    # sharing collection and fixture setup between the two configurations
+    @pytest.fixture(
+        params=[
+            {"eval_str": "int1 + int2", "out_column": "int3"},
+            {"eval_str": "int3 = int1 + int2"},
+        ]
+    )
+    def classparams(self, request):
+        return copy.deepcopy(request.param)
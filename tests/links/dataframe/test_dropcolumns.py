@@ -1,3 +1,5 @@
+import pytest
+
 from pdchemchain.links import DropColumns
 
 from ...basetest import BaseTest
@@ -8,6 +10,11 @@ class TestDropColumns(BaseTest):
     _classparams = {"columns": ["int1"]}
     _alt_classparams = {"columns": ["int2"]}
 
+    # DropColumns is stateless, so the same instance drives all tests
+    @pytest.fixture
+    def link(self, link_cached):
+        return link_cached
+
     def test_dropping_column(self, link, sample_dataframe):
         df_dropped = link(sample_dataframe)
         assert "int1" in sample_dataframe
@@ -1,3 +1,7 @@
+import copy
+
+import pytest
+
 from pdchemchain.links import KeepColumns
 
 from ...basetest import BaseTest
@@ -8,13 +12,15 @@ class TestKeepColumns(BaseTest):
     _classparams = {"columns": ["int1"]}
     _alt_classparams = {"columns": ["int2"]}
 
+    # One parametrized class replaces the former TestKeepColumns/-EmptyConf
+    # pair, sharing collection and fixture setup between the two configurations
+    @pytest.fixture(params=[{"columns": ["int1"]}, {"columns": []}])
+    def classparams(self, request):
+        return copy.deepcopy(request.param)
+
     def test_keep_column(self, link, sample_dataframe):
         df_dropped = link(sample_dataframe)
         assert "int2" in sample_dataframe
         assert "int2" not in df_dropped
-
-
-class TestKeepColumnsEmptyConf(BaseTest):
-    _Link = KeepColumns
-    _classparams = {"columns": []}
-    _alt_classparams = {"columns": ["int2"]}
+        if not link.columns:
+            assert len(df_dropped.columns) == 0
@@ -0,0 +1,13 @@
+from pdchemchain.links import NumexprLink
+
+from ...basetest import BaseTest
+
+
+class TestNumexprLink(BaseTest):
+    _Link = NumexprLink
+    _classparams = {"expression": "int1 + int2", "out_column": "int3"}
+    _alt_classparams = {"expression": "int1 - int2", "out_column": "int4"}
+
+    def test_calculation(self, link, sample_dataframe):
+        df_o = link(sample_dataframe)
+        assert list(df_o.int3.values) == [3, 5, 7]
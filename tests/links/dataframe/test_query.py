@@ -1,3 +1,7 @@
+import copy
+
+import pytest
+
 from pdchemchain.links import Query
 
 from ...basetest import BaseTest
@@ -8,13 +12,16 @@ class TestQuery(BaseTest):
     _classparams = {"query": "int1 > 1"}
     _alt_classparams = {"query": "int2 < 2"}
 
+    # One parametrized class replaces the former TestQuery/-NoConf pair,
+    # sharing collection and fixture setup between the two configurations
+    @pytest.fixture(params=[{"query": "int1 > 1"}, {"query": ""}])
+    def classparams(self, request):
+        return copy.deepcopy(request.param)
+
     def test_query(self, link, sample_dataframe):
         df_dropped = link(sample_dataframe)
-        assert min(df_dropped.int1) > 1
         assert min(sample_dataframe.int1) < 2
-
-
-class TestQueryNoConf(BaseTest):
-    _Link = Query
-    _classparams = {"query": ""}
-    _alt_classparams = {"query": "int2 < 2"}
+        if link.query:
+            assert min(df_dropped.int1) > 1
+        else:
+            assert df_dropped.equals(sample_dataframe)
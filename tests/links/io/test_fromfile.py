@@ -12,26 +12,47 @@ import os, pytest
 class TestToFile(BaseTest):
     _Link = FromFile
 
-    @pytest.fixture
-    def csv_filename(self, tmpdir):
+    # The file is only read by the link, so it is written once per session
+    # instead of re-serialized for every test function
+    @pytest.fixture(scope="session")
+    def csv_filename(self, tmp_path_factory):
         df = pd.DataFrame(
-            pd.DataFrame(
-                {
-                    "int1": [1, 2, 1],
-                    "int2": [2, 3, 4],
-                    "letters1": ["a", "b", "c"],
-                    "Smiles": ["C", "CN", "OCN"],
-                },
-            )
+            {
+                "int1": [1, 2, 1],
+                "int2": [2, 3, 4],
+                "letters1": ["a", "b", "c"],
+                "Smiles": ["C", "CN", "OCN"],
+            },
         )
-        filename = tmpdir + "/load_test1.csv"
+        filename = str(tmp_path_factory.mktemp("fromfile") / "load_test1.csv")
         df.to_csv(filename)
 
         return filename
 
+    # engine is opted in so the multithreaded pyarrow parser path is what
+    # the tests exercise, rather than only the default parser
     @pytest.fixture
     def classparams(self, csv_filename):
-        return {"filename": csv_filename, "pd_readcsv_options": {"sep": ","}}
+        return {
+            "filename": csv_filename,
+            "pd_readcsv_options": {"sep": ","},
+            "engine": "pyarrow",
+        }
+
+    def test_chunked_read_matches_unchunked(self, csv_filename):
+        expected = FromFile(filename=csv_filename)()
+        chunked = FromFile(filename=csv_filename, chunksize=2)
+        pd.testing.assert_frame_equal(chunked(), expected)
+
+    def test_iter_chunks(self, csv_filename):
+        link = FromFile(filename=csv_filename, chunksize=2)
+        chunks = list(link.iter_chunks())
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+
+    def test_iter_chunks_without_chunksize_raises(self, csv_filename):
+        link = FromFile(filename=csv_filename)
+        with pytest.raises(ValueError):
+            next(link.iter_chunks())
 
     @pytest.fixture
     def alt_classparams(self, tmpdir):
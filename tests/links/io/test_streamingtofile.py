@@ -0,0 +1,36 @@
+import pandas as pd
+from pdchemchain.links import StreamingToFile
+
+from ...basetest import BaseTest
+import pytest
+
+import os
+
+
+class TestStreamingToFile(BaseTest):
+    _Link = StreamingToFile
+
+    @pytest.fixture
+    def save_filename(self, tmpdir):
+        return tmpdir + "/stream_test1.csv"
+
+    @pytest.fixture
+    def classparams(self, save_filename):
+        return {"filename": save_filename, "pd_tocsv_options": {"sep": ","}}
+
+    @pytest.fixture
+    def alt_classparams(self, tmpdir):
+        return {
+            "filename": tmpdir + "stream_test2.csv",
+            "pd_tocsv_options": {"sep": "."},
+        }
+
+    def test_saving_file(self, link, sample_dataframe, save_filename):
+        df = link(sample_dataframe)
+        assert os.path.exists(save_filename)
+
+    def test_appends_with_single_header(self, link, sample_dataframe, save_filename):
+        link(sample_dataframe)
+        link(sample_dataframe)
+        df = pd.read_csv(save_filename)
+        assert len(df) == 2 * len(sample_dataframe)
@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+
+from pdchemchain.links.dataframe import DfEval, RowEval
+
+
+@pytest.fixture
+def dataframe():
+    # Non-default index, so the tests also catch a batched run resetting it
+    return pd.DataFrame(
+        {"a": [float(i) for i in range(10)]}, index=range(100, 110)
+    )
+
+
+class TestBatchedApply:
+    """batch_size slicing must not change the result of either dispatch site"""
+
+    def test_batched_link(self, dataframe):
+        # DfEval dispatches through Link.apply
+        link = DfEval(eval_str="a * 2", out_column="b")
+        expected = link(dataframe)
+        link.batch_size = 3
+        pd.testing.assert_frame_equal(link(dataframe), expected)
+
+    def test_batched_rowlink(self, dataframe):
+        # RowEval dispatches through RowLink.apply/_apply_rows
+        link = RowEval(eval_str="row.a * 2", out_column="b")
+        expected = link(dataframe)
+        link.batch_size = 3
+        pd.testing.assert_frame_equal(link(dataframe), expected)
@@ -1,5 +1,8 @@
-from pdchemchain.base import Chain, Link
-from pdchemchain.links.dataframe import NullLink
+import pandas as pd
+
+from pdchemchain.base import Chain, FusedRowLink, Link
+from pdchemchain.links.custom import LinearModelRow
+from pdchemchain.links.dataframe import DfEval, NullLink, RowEval
 import pytest
 from .basetest import BaseTest
 from dataclasses import fields
@@ -35,6 +38,54 @@ class TestChain(BaseTest):
         assert chain.links[1] is link2.links[0]
         assert chain.links[2] is link3.links[0]
 
+    def test_rowlink_fusion(self, sample_dataframe):
+        link1 = RowEval(eval_str="row.int1 + 2", out_column="y")
+        link2 = RowEval(eval_str="row.y * 2", out_column="y2")
+        chain = Chain(links=[link1, link2])
+
+        df_o = chain(sample_dataframe)
+        assert chain._fused_links is not None
+        assert isinstance(chain._fused_links[0], FusedRowLink)
+        assert list(df_o.y.values) == [3.0, 4.0, 5.0]
+        assert list(df_o.y2.values) == [6.0, 8.0, 10.0]
+
+    def test_no_fusion_of_fast_path_links(self, sample_dataframe):
+        # LinearModelRow has a vectorized fast path, which fusing would bypass
+        link1 = LinearModelRow(slope=1, bias=2, in_column="int1", out_column="y")
+        link2 = LinearModelRow(slope=2, bias=0, in_column="y", out_column="y2")
+        chain = Chain(links=[link1, link2])
+
+        df_o = chain(sample_dataframe)
+        assert chain._fused_links == [link1, link2]
+        assert list(df_o.y.values) == [3.0, 4.0, 5.0]
+        assert list(df_o.y2.values) == [6.0, 8.0, 10.0]
+
+    # Early exit is observable through the downstream DfEval: its out_column
+    # only appears in the result if the link actually ran
+    @pytest.mark.parametrize(
+        "dataframe",
+        [
+            pd.DataFrame({"int1": pd.Series([], dtype=float)}),
+            pd.DataFrame({"int1": [1.0, 2.0], "__error__": ["boom", "oops"]}),
+        ],
+        ids=["empty", "all_errors"],
+    )
+    def test_early_exit(self, dataframe):
+        chain = Chain(
+            links=[NullLink(), DfEval(eval_str="int1 * 2", out_column="y")],
+            early_exit=True,
+        )
+        df_o = chain(dataframe)
+        assert "y" not in df_o.columns
+
+    def test_no_early_exit_by_default(self):
+        dataframe = pd.DataFrame({"int1": [1.0, 2.0], "__error__": ["boom", "oops"]})
+        chain = Chain(
+            links=[NullLink(), DfEval(eval_str="int1 * 2", out_column="y")]
+        )
+        df_o = chain(dataframe)
+        assert list(df_o.y.values) == [2.0, 4.0]
+
     def test_cloning_negative(self, link, LinkClass, alt_classparams):
         pass
         # TODO, this is getting a bit weird to test, illustrates trouble between using dicts as kwargs (with Link Objects)
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+from pdchemchain.links.dataframe import RowEval
+
+
+@pytest.fixture
+def dataframe():
+    return pd.DataFrame({"a": [float(i) for i in range(10)]})
+
+
+@pytest.fixture
+def error_dataframe():
+    # Two rows already carry errors and must pass through untouched
+    return pd.DataFrame(
+        {
+            "a": [float(i) for i in range(6)],
+            "__error__": ["", "boom", "", "", "oops", ""],
+        }
+    )
+
+
+class TestParallelApply:
+    """The joblib chunk engine must give the same result as the serial engine"""
+
+    def test_parallel_matches_serial(self, dataframe):
+        link = RowEval(eval_str="row.a * 2", out_column="b")
+        expected = link(dataframe)
+        link.n_jobs = 2
+        pd.testing.assert_frame_equal(link(dataframe), expected)
+
+    def test_parallel_with_error_rows(self, error_dataframe):
+        link = RowEval(eval_str="row.a * 2", out_column="b")
+        expected = link(error_dataframe)
+        link.n_jobs = 2
+        df_o = link(error_dataframe)
+        pd.testing.assert_frame_equal(df_o, expected)
+        # The pre-existing error rows came through unprocessed and in place
+        assert list(df_o.__error__.values) == list(error_dataframe.__error__.values)